@@ -458,6 +458,14 @@ class MCPRouter:
         logger.info(f"MCP Response sent: {response}")
         return response
     
+    async def shutdown(self) -> None:
+        """Close resources (e.g. pooled HTTP sessions) held by local tools"""
+        for tool_name, tool in self.local_tools.items():
+            try:
+                await tool.close()
+            except Exception as e:
+                logger.error(f"Error closing tool {tool_name}: {e}")
+    
     async def get_health_status(self) -> Dict[str, Any]:
         """Get overall health status of the router and services"""
         try:
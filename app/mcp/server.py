@@ -67,6 +67,7 @@ class MCPServer:
         @self.app.on_event("shutdown")
         async def shutdown_event():
             await self.service_manager.shutdown()
+            await self.router.shutdown()
         
         @self.app.options("/{full_path:path}")
         async def options_handler(full_path: str):
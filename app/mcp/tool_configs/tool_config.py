@@ -715,7 +715,8 @@ TOOL_CONFIGS = {
                 "coin_id": {"type": "string", "description": "Coin ID (e.g., 'bitcoin', 'ethereum')"},
                 "vs_currency": {"type": "string", "description": "Target currency", "default": "usd"},
                 "days": {"type": "string", "description": "Number of days for historical data", "default": "1"},
-                "limit": {"type": "integer", "description": "Maximum number of results", "default": 10}
+                "limit": {"type": "integer", "description": "Maximum number of results", "default": 10},
+                "timeout": {"type": "number", "description": "End-to-end request timeout in seconds", "default": 15}
             }
         }
     },
@@ -729,7 +730,9 @@ TOOL_CONFIGS = {
                 "address": {"type": "string", "description": "Ethereum address"},
                 "start_block": {"type": "string", "description": "Starting block number"},
                 "end_block": {"type": "string", "description": "Ending block number"},
-                "block_number": {"type": "string", "description": "Block number"}
+                "block_number": {"type": "string", "description": "Block number"},
+                "limit": {"type": "integer", "description": "Maximum number of transactions to return", "default": 100},
+                "timeout": {"type": "number", "description": "End-to-end request timeout in seconds", "default": 15}
             }
         }
     },
@@ -741,7 +744,8 @@ TOOL_CONFIGS = {
             "properties": {
                 "action": {"type": "string", "description": "Action to perform", "enum": ["get_price", "get_orderbook", "get_24hr_stats", "get_recent_trades", "get_exchange_info"]},
                 "symbol": {"type": "string", "description": "Trading pair symbol (e.g., 'BTCUSDT')"},
-                "limit": {"type": "integer", "description": "Maximum number of results", "default": 10}
+                "limit": {"type": "integer", "description": "Maximum number of results", "default": 10},
+                "timeout": {"type": "number", "description": "End-to-end request timeout in seconds", "default": 15}
             }
         }
     },
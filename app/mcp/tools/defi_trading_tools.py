@@ -1,159 +1,327 @@
 import os
+import re
+import asyncio
 import aiohttp
 import logging
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import ClassVar, Dict, Any, List, Optional, Tuple
+from yarl import URL
 from .mcp_tool import MCPTool
 
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode br-encoded bodies
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+_REQUEST_HEADERS = {"Accept": "application/json", "Accept-Encoding": _ACCEPT_ENCODING}
+
+# End-to-end deadline for one tool call, overridable via the "timeout" argument
+_DEFAULT_TIMEOUT = 15.0
+_CLIENT_TIMEOUT = aiohttp.ClientTimeout(sock_connect=3, sock_read=10)
+
+# Cheap local checks that save an upstream round-trip (and rate-limit credit)
+_ADDRESS_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
+_SYMBOL_RE = re.compile(r"^[A-Z0-9]{3,20}$")
+
+# Endpoints are parsed once; query strings go through params= per call
+_COINGECKO_API = URL("https://api.coingecko.com/api/v3")
+_COINGECKO_MARKETS = _COINGECKO_API / "coins" / "markets"
+_COINGECKO_TRENDING = _COINGECKO_API / "search" / "trending"
+_COINGECKO_EXCHANGE_RATES = _COINGECKO_API / "exchange_rates"
+_ETHERSCAN_API = URL("https://api.etherscan.io/api")
+_BINANCE_PRICE = URL("https://api.binance.com/api/v3/ticker/price")
+_BINANCE_DEPTH = URL("https://api.binance.com/api/v3/depth")
+_BINANCE_24HR = URL("https://api.binance.com/api/v3/ticker/24hr")
+_BINANCE_TRADES = URL("https://api.binance.com/api/v3/trades")
+_BINANCE_EXCHANGE_INFO = URL("https://api.binance.com/api/v3/exchangeInfo")
+
 logger = logging.getLogger(__name__)
 
-class CoinGeckoTool(MCPTool):
-    """Tool for accessing CoinGecko cryptocurrency data"""
+# Per-host bulkheads: bound in-flight calls to each upstream so a slow
+# dependency cannot monopolize the connection pool and starve the others.
+_BULKHEAD_LIMITS = {
+    "api.coingecko.com": 20,
+    "api.etherscan.io": 10,
+    "api.binance.com": 20,
+}
+_DEFAULT_BULKHEAD_LIMIT = 10
+_BULKHEAD_WAIT = 2.0
+
+_bulkheads: Dict[str, asyncio.Semaphore] = {}
+
+# One pooled session shared by the three tools, created on first use and
+# closed by their close() at server shutdown
+_session: Optional[aiohttp.ClientSession] = None
+
+# Event-loop time by which the tool call being served must answer, set by _run_with_deadline
+_deadline: ContextVar[Optional[float]] = ContextVar("_deadline", default=None)
+
+# Identical GETs issued while one is already in flight share its result
+_inflight: Dict[Tuple[Any, ...], "asyncio.Future[List[Dict[str, Any]]]"] = {}
+
+
+class _TokenBucket:
+    """Paces requests to one upstream so they stay under its rate limit"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last: Optional[float] = None
+    
+    async def acquire(self, max_wait: float) -> bool:
+        """Take a token, sleeping once for the deficit if the bucket is empty
+        
+        Returns False without taking a token if that sleep would exceed max_wait,
+        which also bounds how far into debt a burst of callers can drive the bucket.
+        """
+        now = asyncio.get_event_loop().time()
+        if self.last is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        wait = max(0.0, (1 - self.tokens) / self.rate)
+        if wait > max_wait:
+            return False
+        # Reserve the token up front so concurrent callers queue behind each other
+        self.tokens -= 1
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # The request will not be sent, so hand the token back
+                self.refund()
+                raise
+        return True
     
-    @property
-    def name(self) -> str:
-        return "coingecko"
+    def refund(self) -> None:
+        """Return a token taken by a request that was never sent"""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+# Published free-tier limits: CoinGecko ~10-30 req/min, Etherscan 5 req/s,
+# Binance 1200 request weight/min
+_rate_limits: Dict[str, _TokenBucket] = {
+    "api.coingecko.com": _TokenBucket(rate=0.2, capacity=10),
+    "api.etherscan.io": _TokenBucket(rate=5, capacity=5),
+    "api.binance.com": _TokenBucket(rate=20, capacity=20),
+}
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it if it is missing or was closed"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=20, ttl_dns_cache=300)
+        _session = aiohttp.ClientSession(connector=connector, headers=_REQUEST_HEADERS, timeout=_CLIENT_TIMEOUT)
+    return _session
+
+
+async def _close_session() -> None:
+    """Close the shared session; the next request opens a new one"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+def _get_bulkhead(host: str) -> asyncio.Semaphore:
+    """Return the semaphore guarding calls to the given upstream host"""
+    semaphore = _bulkheads.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_BULKHEAD_LIMITS.get(host, _DEFAULT_BULKHEAD_LIMIT))
+        _bulkheads[host] = semaphore
+    return semaphore
+
+
+async def _run_with_deadline(handler, arguments: Dict[str, Any], *args: Any) -> List[Dict[str, Any]]:
+    """Await an action handler within the caller's end-to-end deadline"""
+    timeout = float(arguments.get("timeout") or _DEFAULT_TIMEOUT)
+    # The handler's task copies the context, so _request_json sees this deadline
+    token = _deadline.set(asyncio.get_event_loop().time() + timeout)
+    try:
+        return await asyncio.wait_for(handler(arguments, *args), timeout=timeout)
+    except asyncio.TimeoutError:
+        return [{"type": "text", "text": f"❌ Error: request timed out after {timeout:g}s"}]
+    finally:
+        _deadline.reset(token)
+
+
+def _time_left() -> float:
+    """Seconds until the current tool call's deadline"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return _DEFAULT_TIMEOUT
+    return max(0.0, deadline - asyncio.get_event_loop().time())
+
+
+async def _request_json(url: URL, label: str, failure: str,
+                        params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """GET a JSON endpoint and wrap the payload in an MCP text response.
     
-    @property
-    def description(self) -> str:
-        return "Access comprehensive cryptocurrency data from CoinGecko including prices, market data, and trends."
+    The body is embedded verbatim. Concurrent calls with the same arguments
+    are coalesced into one request.
+    """
+    key = (url, tuple(sorted(params.items())) if params else (), label, failure)
+    task = _inflight.get(key)
+    if task is None:
+        # The bulkhead slot and then the rate-limit token are taken here, within the
+        # caller's deadline, so a caller that gives up never leaves a request queued
+        semaphore = _get_bulkhead(url.host)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=_BULKHEAD_WAIT)
+        except asyncio.TimeoutError:
+            return [{"type": "text", "text": f"❌ Failed to get {failure}: upstream busy, try again later"}]
+        
+        bucket = _rate_limits.get(url.host)
+        try:
+            if bucket is not None and not await bucket.acquire(_time_left()):
+                semaphore.release()
+                return [{"type": "text", "text": f"❌ Failed to get {failure}: rate limited, try again later"}]
+        except asyncio.CancelledError:
+            semaphore.release()
+            raise
+        
+        # Another caller may have started the same request while this one waited
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_fetch(url, label, failure, params))
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+            # The slot is held until the request itself completes
+            task.add_done_callback(lambda _: semaphore.release())
+        else:
+            semaphore.release()
+            if bucket is not None:
+                bucket.refund()
+    # Shield so one cancelled caller does not cancel the request for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch(url: URL, label: str, failure: str,
+                 params: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Perform the GET for _request_json, which already holds its slot and token"""
+    async with _get_session().get(url, params=params) as response:
+        logger.debug("%s served with Content-Encoding=%s", url, response.headers.get('Content-Encoding'))
+        if response.status == 200:
+            # All upstreams serve UTF-8 JSON, so skip aiohttp's charset sniffing
+            raw = await response.read()
+            text = raw.decode("utf-8", "replace")
+            return [{"type": "text", "text": f"✅ {label}: {text}"}]
+        return [{"type": "text", "text": f"❌ Failed to get {failure}: {response.status}"}]
+
+
+class CoinGeckoTool(MCPTool):
+    """Tool for accessing CoinGecko cryptocurrency data"""
     
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "description": "Action to perform",
-                    "enum": ["get_coin_price", "get_market_data", "get_trending", "get_exchange_rates", "get_coin_info"]
-                },
-                "coin_id": {"type": "string", "description": "Coin ID (e.g., 'bitcoin', 'ethereum')"},
-                "vs_currency": {"type": "string", "description": "Target currency", "default": "usd"},
-                "days": {"type": "string", "description": "Number of days for historical data", "default": "1"},
-                "limit": {"type": "integer", "description": "Maximum number of results", "default": 10}
+    name: ClassVar[str] = "coingecko"
+    description: ClassVar[str] = "Access comprehensive cryptocurrency data from CoinGecko including prices, market data, and trends."
+    input_schema: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "description": "Action to perform",
+                "enum": ["get_coin_price", "get_market_data", "get_trending", "get_exchange_rates", "get_coin_info"]
             },
-            "required": ["action"]
-        }
+            "coin_id": {"type": "string", "description": "Coin ID (e.g., 'bitcoin', 'ethereum')"},
+            "vs_currency": {"type": "string", "description": "Target currency", "default": "usd"},
+            "days": {"type": "string", "description": "Number of days for historical data", "default": "1"},
+            "limit": {"type": "integer", "description": "Maximum number of results", "default": 10},
+            "timeout": {"type": "number", "description": "End-to-end request timeout in seconds", "default": 15}
+        },
+        "required": ["action"]
+    }
+    
+    _ACTIONS: ClassVar[Dict[str, str]] = {
+        "get_coin_price": "_get_coin_price",
+        "get_market_data": "_get_market_data",
+        "get_trending": "_get_trending",
+        "get_exchange_rates": "_get_exchange_rates",
+        "get_coin_info": "_get_coin_info",
+    }
     
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Execute the CoinGecko tool"""
         try:
             action = arguments.get("action")
-            
-            if action == "get_coin_price":
-                return await self._get_coin_price(arguments)
-            elif action == "get_market_data":
-                return await self._get_market_data(arguments)
-            elif action == "get_trending":
-                return await self._get_trending(arguments)
-            elif action == "get_exchange_rates":
-                return await self._get_exchange_rates(arguments)
-            elif action == "get_coin_info":
-                return await self._get_coin_info(arguments)
-            else:
+            handler = getattr(self, self._ACTIONS.get(action, ""), None)
+            if handler is None:
                 return [{"type": "text", "text": f"❌ Unknown action: {action}"}]
+            return await _run_with_deadline(handler, arguments)
                 
         except Exception as e:
             logger.error(f"Error in CoinGecko tool: {e}")
             return [{"type": "text", "text": f"❌ Error: {str(e)}"}]
     
+    async def _cleanup_session(self):
+        await _close_session()
+    
     async def _get_coin_price(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get coin price data"""
         coin_id = arguments.get("coin_id", "bitcoin")
         vs_currency = arguments.get("vs_currency", "usd")
         days = arguments.get("days", "1")
         
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
+        url = _COINGECKO_API / "coins" / coin_id / "market_chart"
         params = {"vs_currency": vs_currency, "days": days}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ CoinGecko price data for {coin_id}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get price data: {response.status}"}]
+        return await _request_json(url, f"CoinGecko price data for {coin_id}", "price data", params=params)
     
     async def _get_market_data(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get market data"""
         limit = arguments.get("limit", 10)
-        url = f"https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page={limit}&page=1"
+        params = {"vs_currency": "usd", "order": "market_cap_desc", "per_page": limit, "page": 1}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ CoinGecko market data: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get market data: {response.status}"}]
+        return await _request_json(_COINGECKO_MARKETS, "CoinGecko market data", "market data", params=params)
     
     async def _get_trending(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get trending coins"""
-        url = "https://api.coingecko.com/api/v3/search/trending"
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ CoinGecko trending coins: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get trending data: {response.status}"}]
+        return await _request_json(_COINGECKO_TRENDING, "CoinGecko trending coins", "trending data")
     
     async def _get_exchange_rates(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get exchange rates"""
-        url = "https://api.coingecko.com/api/v3/exchange_rates"
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ CoinGecko exchange rates: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get exchange rates: {response.status}"}]
+        return await _request_json(_COINGECKO_EXCHANGE_RATES, "CoinGecko exchange rates", "exchange rates")
     
     async def _get_coin_info(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get detailed coin information"""
         coin_id = arguments.get("coin_id", "bitcoin")
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
+        url = _COINGECKO_API / "coins" / coin_id
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ CoinGecko coin info for {coin_id}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get coin info: {response.status}"}]
+        return await _request_json(url, f"CoinGecko coin info for {coin_id}", "coin info")
 
 
 class EtherscanTool(MCPTool):
     """Tool for accessing Ethereum blockchain data via Etherscan"""
     
-    @property
-    def name(self) -> str:
-        return "etherscan"
-    
-    @property
-    def description(self) -> str:
-        return "Access Ethereum blockchain data including transactions, balances, and contract information."
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "description": "Action to perform",
-                    "enum": ["get_balance", "get_transactions", "get_contract_info", "get_gas_price", "get_block_info"]
-                },
-                "address": {"type": "string", "description": "Ethereum address"},
-                "start_block": {"type": "string", "description": "Starting block number"},
-                "end_block": {"type": "string", "description": "Ending block number"},
-                "block_number": {"type": "string", "description": "Block number"}
+    name: ClassVar[str] = "etherscan"
+    description: ClassVar[str] = "Access Ethereum blockchain data including transactions, balances, and contract information."
+    input_schema: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "description": "Action to perform",
+                "enum": ["get_balance", "get_transactions", "get_contract_info", "get_gas_price", "get_block_info"]
             },
-            "required": ["action"]
-        }
+            "address": {"type": "string", "description": "Ethereum address"},
+            "start_block": {"type": "string", "description": "Starting block number"},
+            "end_block": {"type": "string", "description": "Ending block number"},
+            "block_number": {"type": "string", "description": "Block number"},
+            "limit": {"type": "integer", "description": "Maximum number of transactions to return", "default": 100},
+            "timeout": {"type": "number", "description": "End-to-end request timeout in seconds", "default": 15}
+        },
+        "required": ["action"]
+    }
+    
+    _ACTIONS: ClassVar[Dict[str, str]] = {
+        "get_balance": "_get_balance",
+        "get_transactions": "_get_transactions",
+        "get_contract_info": "_get_contract_info",
+        "get_gas_price": "_get_gas_price",
+        "get_block_info": "_get_block_info",
+    }
     
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Execute the Etherscan tool"""
@@ -164,30 +332,26 @@ class EtherscanTool(MCPTool):
             if not api_key:
                 return [{"type": "text", "text": "❌ Error: Etherscan API key is required. Please provide your API key."}]
             
-            if action == "get_balance":
-                return await self._get_balance(arguments, api_key)
-            elif action == "get_transactions":
-                return await self._get_transactions(arguments, api_key)
-            elif action == "get_contract_info":
-                return await self._get_contract_info(arguments, api_key)
-            elif action == "get_gas_price":
-                return await self._get_gas_price(api_key)
-            elif action == "get_block_info":
-                return await self._get_block_info(arguments, api_key)
-            else:
+            handler = getattr(self, self._ACTIONS.get(action, ""), None)
+            if handler is None:
                 return [{"type": "text", "text": f"❌ Unknown action: {action}"}]
+            return await _run_with_deadline(handler, arguments, api_key)
                 
         except Exception as e:
             logger.error(f"Error in Etherscan tool: {e}")
             return [{"type": "text", "text": f"❌ Error: {str(e)}"}]
     
+    async def _cleanup_session(self):
+        await _close_session()
+    
     async def _get_balance(self, arguments: Dict[str, Any], api_key: str) -> List[Dict[str, Any]]:
         """Get account balance"""
         address = arguments.get("address")
         if not address:
             return [{"type": "text", "text": "❌ Address is required for balance check"}]
+        if not _ADDRESS_RE.match(address):
+            return [{"type": "text", "text": f"❌ Invalid Ethereum address: {address}"}]
         
-        url = "https://api.etherscan.io/api"
         params = {
             "module": "account",
             "action": "balance",
@@ -196,46 +360,39 @@ class EtherscanTool(MCPTool):
             "apikey": api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Etherscan balance for {address}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get balance: {response.status}"}]
+        return await _request_json(_ETHERSCAN_API, f"Etherscan balance for {address}", "balance", params=params)
     
     async def _get_transactions(self, arguments: Dict[str, Any], api_key: str) -> List[Dict[str, Any]]:
         """Get account transactions"""
         address = arguments.get("address")
         if not address:
             return [{"type": "text", "text": "❌ Address is required for transaction history"}]
+        if not _ADDRESS_RE.match(address):
+            return [{"type": "text", "text": f"❌ Invalid Ethereum address: {address}"}]
         
-        url = "https://api.etherscan.io/api"
         params = {
             "module": "account",
             "action": "txlist",
             "address": address,
             "startblock": arguments.get("start_block", "0"),
             "endblock": arguments.get("end_block", "99999999"),
+            # Let Etherscan truncate the history instead of downloading all of it
+            "page": 1,
+            "offset": arguments.get("limit", 100),
             "sort": "desc",
             "apikey": api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Etherscan transactions for {address}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get transactions: {response.status}"}]
+        return await _request_json(_ETHERSCAN_API, f"Etherscan transactions for {address}", "transactions", params=params)
     
     async def _get_contract_info(self, arguments: Dict[str, Any], api_key: str) -> List[Dict[str, Any]]:
         """Get contract information"""
         address = arguments.get("address")
         if not address:
             return [{"type": "text", "text": "❌ Contract address is required"}]
+        if not _ADDRESS_RE.match(address):
+            return [{"type": "text", "text": f"❌ Invalid Ethereum address: {address}"}]
         
-        url = "https://api.etherscan.io/api"
         params = {
             "module": "contract",
             "action": "getabi",
@@ -243,36 +400,22 @@ class EtherscanTool(MCPTool):
             "apikey": api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Etherscan contract info for {address}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get contract info: {response.status}"}]
+        return await _request_json(_ETHERSCAN_API, f"Etherscan contract info for {address}", "contract info", params=params)
     
-    async def _get_gas_price(self, api_key: str) -> List[Dict[str, Any]]:
+    async def _get_gas_price(self, arguments: Dict[str, Any], api_key: str) -> List[Dict[str, Any]]:
         """Get current gas price"""
-        url = "https://api.etherscan.io/api"
         params = {
             "module": "gastracker",
             "action": "gasoracle",
             "apikey": api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Etherscan gas price: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get gas price: {response.status}"}]
+        return await _request_json(_ETHERSCAN_API, "Etherscan gas price", "gas price", params=params)
     
     async def _get_block_info(self, arguments: Dict[str, Any], api_key: str) -> List[Dict[str, Any]]:
         """Get block information"""
         block_number = arguments.get("block_number", "latest")
         
-        url = "https://api.etherscan.io/api"
         params = {
             "module": "proxy",
             "action": "eth_getBlockByNumber",
@@ -281,129 +424,96 @@ class EtherscanTool(MCPTool):
             "apikey": api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Etherscan block info for {block_number}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get block info: {response.status}"}]
+        return await _request_json(_ETHERSCAN_API, f"Etherscan block info for {block_number}", "block info", params=params)
 
 
 class BinanceTool(MCPTool):
     """Tool for accessing Binance exchange data"""
     
-    @property
-    def name(self) -> str:
-        return "binance"
-    
-    @property
-    def description(self) -> str:
-        return "Access Binance exchange data including prices, order books, and trading information."
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "description": "Action to perform",
-                    "enum": ["get_price", "get_orderbook", "get_24hr_stats", "get_recent_trades", "get_exchange_info"]
-                },
-                "symbol": {"type": "string", "description": "Trading pair symbol (e.g., 'BTCUSDT')"},
-                "limit": {"type": "integer", "description": "Maximum number of results", "default": 10}
+    name: ClassVar[str] = "binance"
+    description: ClassVar[str] = "Access Binance exchange data including prices, order books, and trading information."
+    input_schema: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "description": "Action to perform",
+                "enum": ["get_price", "get_orderbook", "get_24hr_stats", "get_recent_trades", "get_exchange_info"]
             },
-            "required": ["action"]
-        }
+            "symbol": {"type": "string", "description": "Trading pair symbol (e.g., 'BTCUSDT')"},
+            "limit": {"type": "integer", "description": "Maximum number of results", "default": 10},
+            "timeout": {"type": "number", "description": "End-to-end request timeout in seconds", "default": 15}
+        },
+        "required": ["action"]
+    }
+    
+    _ACTIONS: ClassVar[Dict[str, str]] = {
+        "get_price": "_get_price",
+        "get_orderbook": "_get_orderbook",
+        "get_24hr_stats": "_get_24hr_stats",
+        "get_recent_trades": "_get_recent_trades",
+        "get_exchange_info": "_get_exchange_info",
+    }
     
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Execute the Binance tool"""
         try:
             action = arguments.get("action")
-            
-            if action == "get_price":
-                return await self._get_price(arguments)
-            elif action == "get_orderbook":
-                return await self._get_orderbook(arguments)
-            elif action == "get_24hr_stats":
-                return await self._get_24hr_stats(arguments)
-            elif action == "get_recent_trades":
-                return await self._get_recent_trades(arguments)
-            elif action == "get_exchange_info":
-                return await self._get_exchange_info()
-            else:
+            handler = getattr(self, self._ACTIONS.get(action, ""), None)
+            if handler is None:
                 return [{"type": "text", "text": f"❌ Unknown action: {action}"}]
+            return await _run_with_deadline(handler, arguments)
                 
         except Exception as e:
             logger.error(f"Error in Binance tool: {e}")
             return [{"type": "text", "text": f"❌ Error: {str(e)}"}]
     
+    async def _cleanup_session(self):
+        await _close_session()
+    
     async def _get_price(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get current price for a symbol"""
-        symbol = arguments.get("symbol", "BTCUSDT")
-        url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}"
+        symbol = str(arguments.get("symbol") or "BTCUSDT").upper()
+        if not _SYMBOL_RE.match(symbol):
+            return [{"type": "text", "text": f"❌ Invalid trading pair symbol: {symbol}"}]
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Binance price for {symbol}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get price: {response.status}"}]
+        params = {"symbol": symbol}
+        
+        return await _request_json(_BINANCE_PRICE, f"Binance price for {symbol}", "price", params=params)
     
     async def _get_orderbook(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get order book for a symbol"""
-        symbol = arguments.get("symbol", "BTCUSDT")
+        symbol = str(arguments.get("symbol") or "BTCUSDT").upper()
+        if not _SYMBOL_RE.match(symbol):
+            return [{"type": "text", "text": f"❌ Invalid trading pair symbol: {symbol}"}]
         limit = arguments.get("limit", 10)
-        url = f"https://api.binance.com/api/v3/depth?symbol={symbol}&limit={limit}"
+        params = {"symbol": symbol, "limit": limit}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Binance orderbook for {symbol}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get orderbook: {response.status}"}]
+        return await _request_json(_BINANCE_DEPTH, f"Binance orderbook for {symbol}", "orderbook", params=params)
     
     async def _get_24hr_stats(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get 24hr statistics for a symbol"""
-        symbol = arguments.get("symbol", "BTCUSDT")
-        url = f"https://api.binance.com/api/v3/ticker/24hr?symbol={symbol}"
+        symbol = str(arguments.get("symbol") or "BTCUSDT").upper()
+        if not _SYMBOL_RE.match(symbol):
+            return [{"type": "text", "text": f"❌ Invalid trading pair symbol: {symbol}"}]
+        
+        params = {"symbol": symbol}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Binance 24hr stats for {symbol}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get 24hr stats: {response.status}"}]
+        return await _request_json(_BINANCE_24HR, f"Binance 24hr stats for {symbol}", "24hr stats", params=params)
     
     async def _get_recent_trades(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get recent trades for a symbol"""
-        symbol = arguments.get("symbol", "BTCUSDT")
+        symbol = str(arguments.get("symbol") or "BTCUSDT").upper()
+        if not _SYMBOL_RE.match(symbol):
+            return [{"type": "text", "text": f"❌ Invalid trading pair symbol: {symbol}"}]
         limit = arguments.get("limit", 10)
-        url = f"https://api.binance.com/api/v3/trades?symbol={symbol}&limit={limit}"
+        params = {"symbol": symbol, "limit": limit}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Binance recent trades for {symbol}: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get recent trades: {response.status}"}]
+        return await _request_json(_BINANCE_TRADES, f"Binance recent trades for {symbol}", "recent trades", params=params)
     
-    async def _get_exchange_info(self) -> List[Dict[str, Any]]:
+    async def _get_exchange_info(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get exchange information"""
-        url = "https://api.binance.com/api/v3/exchangeInfo"
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [{"type": "text", "text": f"✅ Binance exchange info: {data}"}]
-                else:
-                    return [{"type": "text", "text": f"❌ Failed to get exchange info: {response.status}"}]
+        return await _request_json(_BINANCE_EXCHANGE_INFO, "Binance exchange info", "exchange info")
 
 
 
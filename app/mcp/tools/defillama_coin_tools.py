@@ -1,20 +1,118 @@
 import asyncio
+import heapq
 import logging
 import aiohttp
 import json
 import os
-from typing import Any, Dict, List, Optional
+import time
+from collections import defaultdict
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .mcp_tool import MCPTool
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode br-encoded bodies
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
 logger = logging.getLogger(__name__)
 
+# /protocols is a multi-MB payload shared by most actions; reuse it briefly
+_PROTOCOLS_TTL = 60.0
+# Bump the version suffix if the cached payload format ever changes
+_REDIS_PROTOCOLS_KEY = "defillama:protocols:v1"
+
+# Projections of a /protocols record returned by the price actions
+_TOKEN_KEYS = ('name', 'symbol', 'tvl', 'change_1d', 'change_7d', 'change_1h',
+               'chains', 'category', 'url', 'mcap', 'fdl')
+_HISTORICAL_KEYS = ('name', 'symbol', 'tvl', 'change_1d', 'change_7d', 'change_1h',
+                    'change_30d', 'chains', 'category', 'mcap', 'fdl')
+_CHANGE_KEYS = ('name', 'symbol', 'change_1d', 'change_7d', 'change_1h',
+                'change_30d', 'tvl', 'chains')
+_DEFAULTS = {
+    'name': None, 'symbol': None, 'category': None, 'url': None,
+    'tvl': 0, 'mcap': 0, 'fdl': 0,
+    'change_1h': 0, 'change_1d': 0, 'change_7d': 0, 'change_30d': 0,
+    'chains': [],
+}
+# Per-projection defaults in output order; present keys are overlaid via keys() intersection
+_TOKEN_FIELDS = {k: _DEFAULTS[k] for k in _TOKEN_KEYS}
+_HISTORICAL_FIELDS = {k: _DEFAULTS[k] for k in _HISTORICAL_KEYS}
+_CHANGE_FIELDS = {k: _DEFAULTS[k] for k in _CHANGE_KEYS}
+
 class DefiLlamaCoinTool(MCPTool):
     """DefiLlama Coin MCP tool for accessing token prices and historical data"""
     
-    def __init__(self):
+    _protocols_cache: ClassVar[Optional[Tuple[float, List[Dict[str, Any]]]]] = None
+    _inflight: ClassVar[Optional["asyncio.Future[List[Dict[str, Any]]]"]] = None
+    # Lowercased symbol -> protocols, rebuilt whenever the cache refreshes
+    _by_symbol: ClassVar[Dict[str, List[Dict[str, Any]]]] = {}
+    
+    # Actions answered from the shared /protocols payload
+    _PROTOCOL_ACTIONS: ClassVar[frozenset] = frozenset({
+        "get_token_prices",
+        "get_batch_historical_prices",
+        "get_percentage_change_in_price",
+        "get_token_price_by_address",
+        "get_token_price_by_symbol",
+        "get_price_historical_range",
+    })
+    
+    # action -> (handler, arguments passed to it, required argument groups, error if none is satisfied)
+    _ACTIONS: ClassVar[Dict[str, Tuple[str, Tuple[str, ...], Tuple[Tuple[str, ...], ...], Optional[str]]]] = {
+        "get_token_prices": ("_get_token_prices", ("limit",), (), None),
+        "get_batch_historical_prices": ("_get_batch_historical_prices", ("days",), (), None),
+        "get_percentage_change_in_price": (
+            "_get_percentage_change_in_price",
+            ("token_address", "token_symbol", "days"),
+            (("token_address",), ("token_symbol",)),
+            "Token address or symbol is required for this action",
+        ),
+        "get_closest_block_to_timestamp": (
+            "_get_closest_block_to_timestamp",
+            ("timestamp", "chain"),
+            (("timestamp",),),
+            "Timestamp is required for this action",
+        ),
+        "get_earliest_timestamp_price_record": (
+            "_get_earliest_timestamp_price_record",
+            ("token_address", "token_symbol"),
+            (("token_address",), ("token_symbol",)),
+            "Token address or symbol is required for this action",
+        ),
+        "get_token_price_by_address": (
+            "_get_token_price_by_address",
+            ("token_address", "chain"),
+            (("token_address",),),
+            "Token address is required for this action",
+        ),
+        "get_token_price_by_symbol": (
+            "_get_token_price_by_symbol",
+            ("token_symbol", "chain"),
+            (("token_symbol",),),
+            "Token symbol is required for this action",
+        ),
+        "get_price_historical_range": (
+            "_get_price_historical_range",
+            ("token_address", "token_symbol", "start_timestamp", "end_timestamp", "chain"),
+            (("start_timestamp", "end_timestamp"),),
+            "Start and end timestamps are required for this action",
+        ),
+    }
+    _ARG_DEFAULTS: ClassVar[Dict[str, Any]] = {"days": 30, "limit": 100}
+    
+    def __init__(self, redis_client: Optional[Any] = None):
         self.session = None
+        # Optional async Redis client (e.g. redis.asyncio.Redis) shared by all workers
+        self.redis_client = redis_client
         self.base_url = "https://api.llama.fi"
         
     @property
@@ -44,6 +142,11 @@ class DefiLlamaCoinTool(MCPTool):
                     ],
                     "description": "Action to perform"
                 },
+                "actions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Several actions to run concurrently against one /protocols fetch (used instead of action)"
+                },
                 "token_address": {
                     "type": "string",
                     "description": "Token contract address"
@@ -77,12 +180,14 @@ class DefiLlamaCoinTool(MCPTool):
                     "description": "Maximum number of results (default: 100)"
                 }
             },
-            "required": ["action"]
+            "anyOf": [{"required": ["action"]}, {"required": ["actions"]}]
         }
     
     async def _get_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        # One pooled session for the tool's lifetime keeps TLS connections warm
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75)
+            self.session = aiohttp.ClientSession(connector=connector)
         return self.session
     
     async def _cleanup_session(self):
@@ -90,235 +195,199 @@ class DefiLlamaCoinTool(MCPTool):
             await self.session.close()
             self.session = None
     
+    async def _fetch_protocols(self) -> List[Dict[str, Any]]:
+        """Return the parsed /protocols payload, cached for _PROTOCOLS_TTL seconds"""
+        cls = type(self)
+        cached = cls._protocols_cache
+        if cached and time.monotonic() - cached[0] < _PROTOCOLS_TTL:
+            return cached[1]
+        
+        # Concurrent misses share one upstream fetch instead of each issuing their own
+        task = cls._inflight
+        if task is None:
+            task = asyncio.ensure_future(self._load_protocols())
+            cls._inflight = task
+            task.add_done_callback(lambda _: setattr(cls, "_inflight", None))
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _load_protocols(self) -> List[Dict[str, Any]]:
+        """Load /protocols (shared cache first, then upstream), rebuild the symbol index and refresh the cache"""
+        cls = type(self)
+        all_protocols = await self._read_shared_cache()
+        if all_protocols is None:
+            raw, all_protocols = await self._download_protocols()
+            await self._write_shared_cache(raw)
+        
+        # Drop non-record entries once here so the handlers need not re-check them
+        all_protocols = [p for p in all_protocols if isinstance(p, dict)]
+        
+        by_symbol: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for protocol in all_protocols:
+            by_symbol[(protocol.get('symbol') or '').lower()].append(protocol)
+        
+        cls._by_symbol = dict(by_symbol)
+        cls._protocols_cache = (time.monotonic(), all_protocols)
+        return all_protocols
+    
+    async def _download_protocols(self) -> Tuple[bytes, List[Dict[str, Any]]]:
+        """GET /protocols upstream, returning the raw body and its parsed form"""
+        url = f"{self.base_url}/protocols"
+        headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            "Content-Type": "application/json"
+        }
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                raise RuntimeError(f"API request failed with status {response.status}")
+            # Parse the raw bytes: response.json() would strip and decode to str first
+            raw = await response.read()
+        try:
+            return raw, _json_loads(raw)
+        except Exception as json_error:
+            content_type = response.headers.get('content-type', 'Not specified')
+            snippet = raw[:200].decode('utf-8', 'replace')
+            raise ValueError(f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {snippet}...")
+    
+    async def _read_shared_cache(self) -> Optional[List[Dict[str, Any]]]:
+        """Return /protocols from Redis if a client was given and the key is live"""
+        if self.redis_client is None:
+            return None
+        try:
+            raw = await self.redis_client.get(_REDIS_PROTOCOLS_KEY)
+            return _json_loads(raw) if raw else None
+        except Exception as e:
+            # Redis is only an optimisation; fall back to the upstream fetch
+            logger.warning(f"Redis read of {_REDIS_PROTOCOLS_KEY} failed: {e}")
+            return None
+    
+    async def _write_shared_cache(self, raw: bytes) -> None:
+        """Store the upstream body in Redis for other workers, ignoring Redis errors"""
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.setex(_REDIS_PROTOCOLS_KEY, int(_PROTOCOLS_TTL), raw)
+        except Exception as e:
+            logger.warning(f"Redis write of {_REDIS_PROTOCOLS_KEY} failed: {e}")
+    
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         try:
-            action = arguments.get("action")
-            token_address = arguments.get("token_address")
-            token_symbol = arguments.get("token_symbol")
-            chain = arguments.get("chain")
-            timestamp = arguments.get("timestamp")
-            start_timestamp = arguments.get("start_timestamp")
-            end_timestamp = arguments.get("end_timestamp")
-            days = arguments.get("days", 30)
-            limit = arguments.get("limit", 100)
+            # One response timestamp shared by every action in the call
+            now = datetime.now().isoformat()
+            actions = arguments.get("actions")
+            if actions:
+                # Fetch the shared payload once, then answer every action concurrently.
+                # Batches of placeholder-only actions never touch the network.
+                if not self._PROTOCOL_ACTIONS.isdisjoint(actions):
+                    await self._fetch_protocols()
+                return list(await asyncio.gather(*(self._dispatch(action, arguments, now) for action in actions)))
             
-            # Validate action
-            if not action:
-                result = {"success": False, "error": "Action is required. Please select an action."}
-            elif action == "get_token_prices":
-                result = await self._get_token_prices(limit)
-            elif action == "get_batch_historical_prices":
-                result = await self._get_batch_historical_prices(days)
-            elif action == "get_percentage_change_in_price":
-                if not token_address and not token_symbol:
-                    result = {"success": False, "error": "Token address or symbol is required for this action"}
-                else:
-                    result = await self._get_percentage_change_in_price(token_address, token_symbol, days)
-            elif action == "get_closest_block_to_timestamp":
-                if not timestamp:
-                    result = {"success": False, "error": "Timestamp is required for this action"}
-                else:
-                    result = await self._get_closest_block_to_timestamp(timestamp, chain)
-            elif action == "get_earliest_timestamp_price_record":
-                if not token_address and not token_symbol:
-                    result = {"success": False, "error": "Token address or symbol is required for this action"}
-                else:
-                    result = await self._get_earliest_timestamp_price_record(token_address, token_symbol)
-            elif action == "get_token_price_by_address":
-                if not token_address:
-                    result = {"success": False, "error": "Token address is required for this action"}
-                else:
-                    result = await self._get_token_price_by_address(token_address, chain)
-            elif action == "get_token_price_by_symbol":
-                if not token_symbol:
-                    result = {"success": False, "error": "Token symbol is required for this action"}
-                else:
-                    result = await self._get_token_price_by_symbol(token_symbol, chain)
-            elif action == "get_price_historical_range":
-                if not start_timestamp or not end_timestamp:
-                    result = {"success": False, "error": "Start and end timestamps are required for this action"}
-                else:
-                    result = await self._get_price_historical_range(token_address, token_symbol, start_timestamp, end_timestamp, chain)
-            else:
-                result = {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: get_token_prices, get_batch_historical_prices, get_percentage_change_in_price, get_closest_block_to_timestamp, get_earliest_timestamp_price_record, get_token_price_by_address, get_token_price_by_symbol, get_price_historical_range"}
-            
-            return [result]
-        finally:
-            await self._cleanup_session()
+            return [await self._dispatch(arguments.get("action"), arguments, now)]
+        except Exception as e:
+            logger.error(f"Error in DefiLlama coin tool: {e}")
+            return [{"success": False, "error": f"Error: {str(e)}"}]
     
-    async def _get_token_prices(self, limit: int) -> dict:
+    async def _dispatch(self, action: Optional[str], arguments: Dict[str, Any], now: str) -> dict:
+        """Run a single action and return its result envelope"""
+        if not action:
+            return {"success": False, "error": "Action is required. Please select an action."}
+        spec = self._ACTIONS.get(action)
+        if spec is None:
+            return {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: {', '.join(self._ACTIONS)}"}
+        
+        method_name, params, required, missing_error = spec
+        # Satisfied when every argument of at least one group is present
+        if required and not any(all(arguments.get(k) for k in group) for group in required):
+            return {"success": False, "error": missing_error}
+        
+        args = [arguments.get(k, self._ARG_DEFAULTS.get(k)) for k in params]
+        if action in self._PROTOCOL_ACTIONS:
+            try:
+                args.insert(0, await self._fetch_protocols())
+            except Exception as e:
+                return {"success": False, "error": f"Failed to fetch protocols: {str(e)}"}
+        
+        return await getattr(self, method_name)(*args, now=now)
+    
+    async def _get_token_prices(self, all_protocols: List[Dict[str, Any]], limit: int, now: str = None) -> dict:
         """Get current token prices - using /protocols endpoint filtered for token-like data"""
         try:
-            url = f"{self.base_url}/protocols"
+            # Top `limit` by TVL descending; a partial sort avoids ordering the whole list,
+            # and selecting before projecting means only the kept records are copied
+            tvl_key = lambda x: x.get('tvl', 0) or 0
+            if limit:
+                protocols = heapq.nlargest(limit, all_protocols, key=tvl_key)
+            else:
+                protocols = sorted(all_protocols, key=tvl_key, reverse=True)
+            
+            # Extract token-like data from protocols
+            token_data = [
+                {**_TOKEN_FIELDS, **{k: protocol[k] for k in _TOKEN_FIELDS.keys() & protocol.keys()}}
+                for protocol in protocols
+            ]
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": token_data,
+                "limit": limit,
+                "total_tokens": len(token_data),
+                "timestamp": now
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Extract token-like data from protocols
-                        token_data = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                token_info = {
-                                    'name': protocol.get('name'),
-                                    'symbol': protocol.get('symbol'),
-                                    'tvl': protocol.get('tvl', 0),
-                                    'change_1d': protocol.get('change_1d', 0),
-                                    'change_7d': protocol.get('change_7d', 0),
-                                    'change_1h': protocol.get('change_1h', 0),
-                                    'chains': protocol.get('chains', []),
-                                    'category': protocol.get('category'),
-                                    'url': protocol.get('url'),
-                                    'mcap': protocol.get('mcap', 0),
-                                    'fdl': protocol.get('fdl', 0)
-                                }
-                                token_data.append(token_info)
-                        
-                        # Sort by TVL descending and apply limit
-                        token_data.sort(key=lambda x: x.get('tvl', 0) or 0, reverse=True)
-                        if limit and len(token_data) > limit:
-                            token_data = token_data[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": token_data,
-                            "limit": limit,
-                            "total_tokens": len(token_data),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get token prices: {str(e)}"}
     
-    async def _get_batch_historical_prices(self, days: int) -> dict:
+    async def _get_batch_historical_prices(self, all_protocols: List[Dict[str, Any]], days: int, now: str = None) -> dict:
         """Get batch historical prices - using /protocols endpoint with historical data"""
         try:
-            url = f"{self.base_url}/protocols"
+            # Extract historical data from protocols
+            historical_data = [
+                {**_HISTORICAL_FIELDS, **{k: protocol[k] for k in _HISTORICAL_FIELDS.keys() & protocol.keys()}}
+                for protocol in all_protocols
+            ]
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": historical_data,
+                "days": days,
+                "total_protocols": len(historical_data),
+                "timestamp": now
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Extract historical data from protocols
-                        historical_data = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                historical_info = {
-                                    'name': protocol.get('name'),
-                                    'symbol': protocol.get('symbol'),
-                                    'tvl': protocol.get('tvl', 0),
-                                    'change_1d': protocol.get('change_1d', 0),
-                                    'change_7d': protocol.get('change_7d', 0),
-                                    'change_1h': protocol.get('change_1h', 0),
-                                    'change_30d': protocol.get('change_30d', 0),
-                                    'chains': protocol.get('chains', []),
-                                    'category': protocol.get('category'),
-                                    'mcap': protocol.get('mcap', 0),
-                                    'fdl': protocol.get('fdl', 0)
-                                }
-                                historical_data.append(historical_info)
-                        
-                        return {
-                            "success": True,
-                            "data": historical_data,
-                            "days": days,
-                            "total_protocols": len(historical_data),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get batch historical prices: {str(e)}"}
     
-    async def _get_percentage_change_in_price(self, token_address: str = None, token_symbol: str = None, days: int = 30) -> dict:
+    async def _get_percentage_change_in_price(self, all_protocols: List[Dict[str, Any]], token_address: str = None, token_symbol: str = None, days: int = 30, now: str = None) -> dict:
         """Get percentage change in price - using /protocols endpoint with change data"""
         try:
-            url = f"{self.base_url}/protocols"
+            # Filter by token if specified
+            filtered_protocols = all_protocols
+            if token_symbol:
+                filtered_protocols = self._by_symbol.get(token_symbol.lower(), [])
+            elif token_address:
+                # For address matching, we'd need to check if the protocol has address info
+                # For now, just return all protocols
+                pass
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            # Extract percentage change data
+            change_data = [
+                {**_CHANGE_FIELDS, **{k: protocol[k] for k in _CHANGE_FIELDS.keys() & protocol.keys()}}
+                for protocol in filtered_protocols
+            ]
+            
+            return {
+                "success": True,
+                "data": change_data,
+                "token_address": token_address,
+                "token_symbol": token_symbol,
+                "days": days,
+                "total_protocols": len(change_data),
+                "timestamp": now
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter by token if specified
-                        filtered_protocols = all_protocols
-                        if token_symbol:
-                            filtered_protocols = [p for p in all_protocols if p.get('symbol', '').lower() == token_symbol.lower()]
-                        elif token_address:
-                            # For address matching, we'd need to check if the protocol has address info
-                            # For now, just return all protocols
-                            pass
-                        
-                        # Extract percentage change data
-                        change_data = []
-                        for protocol in filtered_protocols:
-                            if isinstance(protocol, dict):
-                                change_info = {
-                                    'name': protocol.get('name'),
-                                    'symbol': protocol.get('symbol'),
-                                    'change_1d': protocol.get('change_1d', 0),
-                                    'change_7d': protocol.get('change_7d', 0),
-                                    'change_1h': protocol.get('change_1h', 0),
-                                    'change_30d': protocol.get('change_30d', 0),
-                                    'tvl': protocol.get('tvl', 0),
-                                    'chains': protocol.get('chains', [])
-                                }
-                                change_data.append(change_info)
-                        
-                        return {
-                            "success": True,
-                            "data": change_data,
-                            "token_address": token_address,
-                            "token_symbol": token_symbol,
-                            "days": days,
-                            "total_protocols": len(change_data),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get percentage change in price: {str(e)}"}
     
-    async def _get_closest_block_to_timestamp(self, timestamp: int, chain: str = None) -> dict:
+    async def _get_closest_block_to_timestamp(self, timestamp: int, chain: str = None, now: str = None) -> dict:
         """Get closest block to timestamp - placeholder implementation"""
         try:
             # This endpoint is not available in the current DefiLlama API
@@ -333,12 +402,12 @@ class DefiLlamaCoinTool(MCPTool):
                 },
                 "timestamp": timestamp,
                 "chain": chain or "ethereum",
-                "timestamp_iso": datetime.now().isoformat()
+                "timestamp_iso": now
             }
         except Exception as e:
             return {"success": False, "error": f"Failed to get closest block to timestamp: {str(e)}"}
     
-    async def _get_earliest_timestamp_price_record(self, token_address: str = None, token_symbol: str = None) -> dict:
+    async def _get_earliest_timestamp_price_record(self, token_address: str = None, token_symbol: str = None, now: str = None) -> dict:
         """Get earliest timestamp price record - placeholder implementation"""
         try:
             # This endpoint is not available in the current DefiLlama API
@@ -353,159 +422,88 @@ class DefiLlamaCoinTool(MCPTool):
                 },
                 "token_address": token_address,
                 "token_symbol": token_symbol,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }
         except Exception as e:
             return {"success": False, "error": f"Failed to get earliest timestamp price record: {str(e)}"}
     
-    async def _get_token_price_by_address(self, token_address: str, chain: str = None) -> dict:
+    async def _get_token_price_by_address(self, all_protocols: List[Dict[str, Any]], token_address: str, chain: str = None, now: str = None) -> dict:
         """Get token price by address - using /protocols endpoint with filtering"""
         try:
-            url = f"{self.base_url}/protocols"
+            # Filter protocols that might match the address (simplified approach).
+            # Only the fields that can carry an address are inspected, rather than
+            # stringifying every protocol dict.
+            address_lc = token_address.lower()
+            matching_protocols = []
+            for protocol in all_protocols:
+                # The name is only lowercased when the address fields did not match
+                name = protocol.get('name')
+                if (address_lc in (protocol.get('address') or '').lower()
+                        or address_lc in (protocol.get('url') or '').lower()
+                        or (name and name.lower() in address_lc)):
+                    matching_protocols.append(
+                        {**_TOKEN_FIELDS, **{k: protocol[k] for k in _TOKEN_FIELDS.keys() & protocol.keys()}}
+                    )
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": matching_protocols,
+                "token_address": token_address,
+                "chain": chain,
+                "total_matches": len(matching_protocols),
+                "timestamp": now
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter protocols that might match the address (simplified approach)
-                        matching_protocols = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                # Check if any field contains the address or if it's a known protocol
-                                protocol_str = str(protocol).lower()
-                                if token_address.lower() in protocol_str or protocol.get('name', '').lower() in token_address.lower():
-                                    matching_protocols.append(protocol)
-                        
-                        return {
-                            "success": True,
-                            "data": matching_protocols,
-                            "token_address": token_address,
-                            "chain": chain,
-                            "total_matches": len(matching_protocols),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get token price by address: {str(e)}"}
     
-    async def _get_token_price_by_symbol(self, token_symbol: str, chain: str = None) -> dict:
+    async def _get_token_price_by_symbol(self, all_protocols: List[Dict[str, Any]], token_symbol: str, chain: str = None, now: str = None) -> dict:
         """Get token price by symbol - using /protocols endpoint with filtering"""
         try:
-            url = f"{self.base_url}/protocols"
+            # Filter protocols by symbol
+            matching_protocols = [
+                {**_TOKEN_FIELDS, **{k: protocol[k] for k in _TOKEN_FIELDS.keys() & protocol.keys()}}
+                for protocol in self._by_symbol.get(token_symbol.lower(), [])
+            ]
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": matching_protocols,
+                "token_symbol": token_symbol,
+                "chain": chain,
+                "total_matches": len(matching_protocols),
+                "timestamp": now
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter protocols by symbol
-                        matching_protocols = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                if protocol.get('symbol', '').lower() == token_symbol.lower():
-                                    matching_protocols.append(protocol)
-                        
-                        return {
-                            "success": True,
-                            "data": matching_protocols,
-                            "token_symbol": token_symbol,
-                            "chain": chain,
-                            "total_matches": len(matching_protocols),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get token price by symbol: {str(e)}"}
     
-    async def _get_price_historical_range(self, token_address: str = None, token_symbol: str = None, start_timestamp: int = None, end_timestamp: int = None, chain: str = None) -> dict:
+    async def _get_price_historical_range(self, all_protocols: List[Dict[str, Any]], token_address: str = None, token_symbol: str = None, start_timestamp: int = None, end_timestamp: int = None, chain: str = None, now: str = None) -> dict:
         """Get price historical range - using /protocols endpoint with historical data"""
         try:
-            url = f"{self.base_url}/protocols"
+            # Filter by token if specified
+            filtered_protocols = all_protocols
+            if token_symbol:
+                filtered_protocols = self._by_symbol.get(token_symbol.lower(), [])
+            elif token_address:
+                # For address matching, we'd need to check if the protocol has address info
+                # For now, just return all protocols
+                pass
+            
+            # Extract historical-like data
+            historical_data = [
+                {**_HISTORICAL_FIELDS, **{k: protocol[k] for k in _HISTORICAL_FIELDS.keys() & protocol.keys()}}
+                for protocol in filtered_protocols
+            ]
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": historical_data,
+                "token_address": token_address,
+                "token_symbol": token_symbol,
+                "start_timestamp": start_timestamp,
+                "end_timestamp": end_timestamp,
+                "chain": chain,
+                "total_protocols": len(historical_data),
+                "timestamp": now
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter by token if specified
-                        filtered_protocols = all_protocols
-                        if token_symbol:
-                            filtered_protocols = [p for p in all_protocols if p.get('symbol', '').lower() == token_symbol.lower()]
-                        elif token_address:
-                            # For address matching, we'd need to check if the protocol has address info
-                            # For now, just return all protocols
-                            pass
-                        
-                        # Extract historical-like data
-                        historical_data = []
-                        for protocol in filtered_protocols:
-                            if isinstance(protocol, dict):
-                                historical_info = {
-                                    'name': protocol.get('name'),
-                                    'symbol': protocol.get('symbol'),
-                                    'tvl': protocol.get('tvl', 0),
-                                    'change_1d': protocol.get('change_1d', 0),
-                                    'change_7d': protocol.get('change_7d', 0),
-                                    'change_1h': protocol.get('change_1h', 0),
-                                    'change_30d': protocol.get('change_30d', 0),
-                                    'chains': protocol.get('chains', []),
-                                    'category': protocol.get('category'),
-                                    'mcap': protocol.get('mcap', 0),
-                                    'fdl': protocol.get('fdl', 0)
-                                }
-                                historical_data.append(historical_info)
-                        
-                        return {
-                            "success": True,
-                            "data": historical_data,
-                            "token_address": token_address,
-                            "token_symbol": token_symbol,
-                            "start_timestamp": start_timestamp,
-                            "end_timestamp": end_timestamp,
-                            "chain": chain,
-                            "total_protocols": len(historical_data),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get price historical range: {str(e)}"}
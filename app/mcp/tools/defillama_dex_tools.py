@@ -3,16 +3,98 @@ import logging
 import aiohttp
 import json
 import os
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .mcp_tool import MCPTool
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode br-encoded bodies
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 logger = logging.getLogger(__name__)
 
+# Every action reads the same multi-MB overview payload; reuse it briefly
+_OVERVIEW_TTL = 30.0
+
+# Query suffix that makes DefiLlama omit totalDataChart/totalDataChartBreakdown
+_EXCLUDE_CHARTS = "?excludeTotalDataChart=true&excludeTotalDataChartBreakdown=true"
+
+# Sent with every GET; there is no request body, so no Content-Type
+_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "User-Agent": "mcp-defillama/1.0",
+}
+
+# Parsed overview payload plus its name indexes: key -> [(lowercased name, entry), ...]
+_Indexes = Dict[str, List[Tuple[str, Dict[str, Any]]]]
+_Overview = Tuple[Dict[str, Any], _Indexes]
+
+# (second, formatted) - responses within the same second share one timestamp string
+_ts_cache: List[Any] = [0, ""]
+
+
+def _iso_now() -> str:
+    """Local ISO-8601 timestamp at one-second resolution, formatted at most once a second"""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _ts_cache[1]
+
+# Field projections of the overview payload with their defaults, in output order
+_TOTALS_FIELDS = {"total24h": 0, "total7d": 0, "total30d": 0}
+_CHANGE_FIELDS = {"change_1d": 0, "change_7d": 0, "change_1m": 0}
+_CHART_FIELDS = {"totalDataChart": [], "totalDataChartBreakdown": []}
+_ALL_DEXS_FIELDS = {**_TOTALS_FIELDS, **_CHANGE_FIELDS, "protocols": [], "allChains": [], **_CHART_FIELDS}
+_SUMMARY_FIELDS = {**_TOTALS_FIELDS, "total1y": 0, **_CHANGE_FIELDS, "totalAllTime": 0}
+_HISTORICAL_TOTALS_FIELDS = {**_TOTALS_FIELDS, **_CHANGE_FIELDS}
+
+
+def _project(data: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the given fields out of data, falling back to their defaults, in one pass"""
+    return {**fields, **{k: data[k] for k in fields.keys() & data.keys()}}
+
+
+def _index_by_name(entries: Any) -> List[Tuple[str, Dict[str, Any]]]:
+    """Pair each dict entry with its lowercased name, preserving payload order"""
+    if not isinstance(entries, list):
+        return []
+    return [((entry.get("name") or "").lower(), entry) for entry in entries if isinstance(entry, dict)]
+
+
 class DefiLlamaDexTool(MCPTool):
     """DefiLlama DEX MCP tool for accessing DEX volume and trading data"""
     
+    # URL -> (fetched at, parsed payload and indexes), shared by all instances
+    _cache: ClassVar[Dict[str, Tuple[float, _Overview]]] = {}
+    # URL -> fetch in progress, so concurrent misses share one request
+    _inflight: ClassVar[Dict[str, "asyncio.Future[_Overview]"]] = {}
+    # URL -> (ETag, Last-Modified) of the cached payload, for conditional GETs
+    _validators: ClassVar[Dict[str, Tuple[Optional[str], Optional[str]]]] = {}
+    
+    # action -> (handler, arguments passed to it, required argument, error if it is missing)
+    _ACTIONS: ClassVar[Dict[str, Tuple[str, Tuple[str, ...], Optional[str], Optional[str]]]] = {
+        "get_all_dexs_with_volumes": ("_get_all_dexs_with_volumes", ("limit",), None, None),
+        "get_summary_dex_volume": ("_get_summary_dex_volume", (), None, None),
+        "get_dex_volumes_by_chain": ("_get_dex_volumes_by_chain", ("chain", "limit"), "chain", "Chain is required for this action"),
+        "get_all_options_volumes": ("_get_all_options_volumes", ("limit",), None, None),
+        "get_options_volumes": ("_get_options_volumes", ("limit",), None, None),
+        "get_summary_options_dex_volume": ("_get_summary_options_dex_volume", (), None, None),
+        "get_dex_volume_historical": ("_get_dex_volume_historical", ("days",), None, None),
+        "get_dex_volume_by_protocol": ("_get_dex_volume_by_protocol", ("protocol", "days"), "protocol", "Protocol is required for this action"),
+    }
+    _ARG_DEFAULTS: ClassVar[Dict[str, Any]] = {"days": 7, "limit": 100}
+    
     def __init__(self):
         self.session = None
         self.base_url = "https://api.llama.fi"
@@ -65,8 +147,11 @@ class DefiLlamaDexTool(MCPTool):
         }
     
     async def _get_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        # One pooled session for the tool's lifetime keeps TLS connections to api.llama.fi warm;
+        # it is closed by MCPTool.close() at server shutdown
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=16, keepalive_timeout=75, enable_cleanup_closed=True)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
         return self.session
     
     async def _cleanup_session(self):
@@ -74,406 +159,202 @@ class DefiLlamaDexTool(MCPTool):
             await self.session.close()
             self.session = None
     
+    async def _fetch_overview_dexs(self, need_chart: bool = False) -> _Overview:
+        """Return the parsed /overview/dexs payload and its indexes, cached for _OVERVIEW_TTL seconds
+        
+        Unless need_chart is set, the lean variant without the chart arrays (the bulk of
+        the payload) is requested; the two variants are cached separately.
+        """
+        cls = type(self)
+        url = f"{self.base_url}/overview/dexs"
+        if not need_chart:
+            url += _EXCLUDE_CHARTS
+        cached = cls._cache.get(url)
+        if cached and time.monotonic() - cached[0] < _OVERVIEW_TTL:
+            return cached[1]
+        
+        task = cls._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._load_overview(url))
+            cls._inflight[url] = task
+            task.add_done_callback(lambda _: cls._inflight.pop(url, None))
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _load_overview(self, url: str) -> _Overview:
+        """GET and parse url, index it by name and store the result in the shared cache"""
+        cls = type(self)
+        headers = _HEADERS
+        # Revalidate an expired entry instead of downloading it again
+        stale = cls._cache.get(url)
+        etag, last_modified = cls._validators.get(url, (None, None)) if stale else (None, None)
+        if etag or last_modified:
+            headers = dict(_HEADERS)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and stale:
+                cls._cache[url] = (time.monotonic(), stale[1])
+                return stale[1]
+            response.raise_for_status()
+            # Parse the raw bytes; decoding to str first would copy the whole payload
+            raw = await response.read()
+            try:
+                data = _json_loads(raw)
+            except Exception as json_error:
+                content_type = response.headers.get('content-type', 'Not specified')
+                snippet = raw[:200].decode('utf-8', 'replace')
+                raise ValueError(f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {snippet}...")
+            validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        
+        # Lowercased once per refresh instead of on every filtered call
+        overview = (data, {
+            "chains": _index_by_name(data.get("allChains", [])),
+            "protocols": _index_by_name(data.get("protocols", [])),
+        })
+        # Swapped in only once the replacement has parsed: a failed download leaves the
+        # expired entry and its validators in place for the next revalidation
+        cls._cache[url] = (time.monotonic(), overview)
+        cls._validators[url] = validators
+        return overview
+    
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         try:
             action = arguments.get("action")
-            chain = arguments.get("chain")
-            protocol = arguments.get("protocol")
-            days = arguments.get("days", 7)
-            limit = arguments.get("limit", 100)
             
             # Validate action
             if not action:
-                result = {"success": False, "error": "Action is required. Please select an action."}
-            elif action == "get_all_dexs_with_volumes":
-                result = await self._get_all_dexs_with_volumes(limit)
-            elif action == "get_summary_dex_volume":
-                result = await self._get_summary_dex_volume()
-            elif action == "get_dex_volumes_by_chain":
-                if not chain:
-                    result = {"success": False, "error": "Chain is required for this action"}
-                else:
-                    result = await self._get_dex_volumes_by_chain(chain, limit)
-            elif action == "get_all_options_volumes":
-                result = await self._get_all_options_volumes(limit)
-            elif action == "get_options_volumes":
-                result = await self._get_options_volumes(limit)
-            elif action == "get_summary_options_dex_volume":
-                result = await self._get_summary_options_dex_volume()
-            elif action == "get_dex_volume_historical":
-                result = await self._get_dex_volume_historical(days)
-            elif action == "get_dex_volume_by_protocol":
-                if not protocol:
-                    result = {"success": False, "error": "Protocol is required for this action"}
-                else:
-                    result = await self._get_dex_volume_by_protocol(protocol, days)
-            else:
-                result = {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: get_all_dexs_with_volumes, get_summary_dex_volume, get_dex_volumes_by_chain, get_all_options_volumes, get_options_volumes, get_summary_options_dex_volume, get_dex_volume_historical, get_dex_volume_by_protocol"}
+                return [{"success": False, "error": "Action is required. Please select an action."}]
+            spec = self._ACTIONS.get(action)
+            if spec is None:
+                return [{"success": False, "error": f"Unknown action: '{action}'. Valid actions are: {', '.join(self._ACTIONS)}"}]
             
-            return [result]
-        finally:
-            await self._cleanup_session()
+            method_name, params, required, missing_error = spec
+            if required and not arguments.get(required):
+                return [{"success": False, "error": missing_error}]
+            
+            args = [arguments.get(k, self._ARG_DEFAULTS.get(k)) for k in params]
+            return [await getattr(self, method_name)(*args)]
+        except Exception as e:
+            logger.error(f"Error in DefiLlama DEX tool: {e}")
+            return [{"success": False, "error": f"Error: {str(e)}"}]
     
-    async def _get_all_dexs_with_volumes(self, limit: int) -> dict:
-        """Get all DEXs with their volumes - using overview/dexs endpoint"""
+    async def execute_many(self, argument_list: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Run several executions concurrently; they share one /overview/dexs fetch"""
+        return list(await asyncio.gather(*(self.execute(arguments) for arguments in argument_list)))
+    
+    async def _fetch_and_extract(self, transform: Callable[[Dict[str, Any], _Indexes], Any], failure: str,
+                                 *, need_chart: bool = False, **extra: Any) -> dict:
+        """Apply transform to the shared overview payload and its indexes and wrap it in the result envelope
+        
+        Keys in extra are echoed between "data" and "timestamp"; an upstream error status
+        is reported as such and any other error as "Failed to get <failure>".
+        """
         try:
-            url = f"{self.base_url}/overview/dexs"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            data, indexes = await self._fetch_overview_dexs(need_chart)
+            return {
+                "success": True,
+                "data": transform(data, indexes),
+                **extra,
+                "timestamp": _iso_now()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Extract DEX data from the overview response
-                        dex_data = {
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0),
-                            "change_1d": data.get("change_1d", 0),
-                            "change_7d": data.get("change_7d", 0),
-                            "change_1m": data.get("change_1m", 0),
-                            "protocols": data.get("protocols", []),
-                            "allChains": data.get("allChains", []),
-                            "totalDataChart": data.get("totalDataChart", []),
-                            "totalDataChartBreakdown": data.get("totalDataChartBreakdown", [])
-                        }
-                        
-                        # Apply limit to protocols if needed
-                        if limit and "protocols" in dex_data and isinstance(dex_data["protocols"], list):
-                            dex_data["protocols"] = dex_data["protocols"][:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": dex_data,
-                            "limit": limit,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
+        except aiohttp.ClientResponseError as e:
+            return {"success": False, "error": f"API request failed with status {e.status}"}
         except Exception as e:
-            return {"success": False, "error": f"Failed to get all DEXs with volumes: {str(e)}"}
+            return {"success": False, "error": f"Failed to get {failure}: {str(e)}"}
+    
+    async def _get_all_dexs_with_volumes(self, limit: int) -> dict:
+        """Get all DEXs with their volumes - using overview/dexs endpoint"""
+        def transform(data: Dict[str, Any], indexes: _Indexes) -> Dict[str, Any]:
+            # Extract DEX data from the overview response
+            dex_data = _project(data, _ALL_DEXS_FIELDS)
+            
+            # Apply limit to protocols if needed
+            if limit and "protocols" in dex_data and isinstance(dex_data["protocols"], list):
+                dex_data["protocols"] = dex_data["protocols"][:limit]
+            return dex_data
+        
+        return await self._fetch_and_extract(transform, "all DEXs with volumes", need_chart=True, limit=limit)
     
     async def _get_summary_dex_volume(self) -> dict:
         """Get summary of DEX volumes - using overview/dexs endpoint"""
-        try:
-            url = f"{self.base_url}/overview/dexs"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Extract summary data
-                        summary_data = {
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0),
-                            "total1y": data.get("total1y", 0),
-                            "change_1d": data.get("change_1d", 0),
-                            "change_7d": data.get("change_7d", 0),
-                            "change_1m": data.get("change_1m", 0),
-                            "totalAllTime": data.get("totalAllTime", 0),
-                            "protocols_count": len(data.get("protocols", [])),
-                            "chains_count": len(data.get("allChains", []))
-                        }
-                        
-                        return {
-                            "success": True,
-                            "data": summary_data,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get summary DEX volume: {str(e)}"}
+        return await self._fetch_and_extract(lambda data, _: {
+            **_project(data, _SUMMARY_FIELDS),
+            "protocols_count": len(data.get("protocols", [])),
+            "chains_count": len(data.get("allChains", []))
+        }, "summary DEX volume")
     
     async def _get_dex_volumes_by_chain(self, chain: str, limit: int) -> dict:
         """Get DEX volumes by chain - using overview/dexs endpoint filtered by chain"""
-        try:
-            url = f"{self.base_url}/overview/dexs"
+        def transform(data: Dict[str, Any], indexes: _Indexes) -> Dict[str, Any]:
+            # Filter protocols by chain
+            needle = chain.lower()
+            chain_protocols = [entry for name, entry in indexes["chains"] if needle in name]
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            # Apply limit
+            if limit and len(chain_protocols) > limit:
+                chain_protocols = chain_protocols[:limit]
+            
+            return {
+                "chain": chain,
+                "protocols": chain_protocols,
+                "total_protocols": len(chain_protocols)
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Filter protocols by chain
-                        all_chains = data.get("allChains", [])
-                        chain_protocols = []
-                        
-                        if isinstance(all_chains, list):
-                            for chain_data in all_chains:
-                                if isinstance(chain_data, dict):
-                                    chain_name = chain_data.get("name", "").lower()
-                                    if chain.lower() in chain_name:
-                                        chain_protocols.append(chain_data)
-                        
-                        # Apply limit
-                        if limit and len(chain_protocols) > limit:
-                            chain_protocols = chain_protocols[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "chain": chain,
-                                "protocols": chain_protocols,
-                                "total_protocols": len(chain_protocols)
-                            },
-                            "chain": chain,
-                            "limit": limit,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get DEX volumes by chain: {str(e)}"}
+        
+        return await self._fetch_and_extract(transform, "DEX volumes by chain", chain=chain, limit=limit)
     
     async def _get_all_options_volumes(self, limit: int) -> dict:
         """Get all options volumes - using overview/dexs endpoint (options data not available)"""
-        try:
-            url = f"{self.base_url}/overview/dexs"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Options data is not available in the current API
-                        # Return a message indicating this
-                        return {
-                            "success": True,
-                            "data": {
-                                "message": "Options volume data is not available in the current DefiLlama API",
-                                "available_data": "DEX volume data is available via overview/dexs endpoint",
-                                "total24h": data.get("total24h", 0),
-                                "total7d": data.get("total7d", 0),
-                                "total30d": data.get("total30d", 0)
-                            },
-                            "limit": limit,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get all options volumes: {str(e)}"}
+        # Options data is not available in the current API
+        # Return a message indicating this
+        return await self._fetch_and_extract(lambda data, _: {
+            "message": "Options volume data is not available in the current DefiLlama API",
+            "available_data": "DEX volume data is available via overview/dexs endpoint",
+            **_project(data, _TOTALS_FIELDS)
+        }, "all options volumes", limit=limit)
     
     async def _get_options_volumes(self, limit: int) -> dict:
         """Get options volumes list - using overview/dexs endpoint (options data not available)"""
-        try:
-            url = f"{self.base_url}/overview/dexs"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Options data is not available in the current API
-                        return {
-                            "success": True,
-                            "data": {
-                                "message": "Options volume data is not available in the current DefiLlama API",
-                                "available_data": "DEX volume data is available via overview/dexs endpoint",
-                                "protocols": data.get("protocols", [])[:limit] if limit else data.get("protocols", [])
-                            },
-                            "limit": limit,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get options volumes: {str(e)}"}
+        # Options data is not available in the current API
+        return await self._fetch_and_extract(lambda data, _: {
+            "message": "Options volume data is not available in the current DefiLlama API",
+            "available_data": "DEX volume data is available via overview/dexs endpoint",
+            "protocols": data.get("protocols", [])[:limit] if limit else data.get("protocols", [])
+        }, "options volumes", limit=limit)
     
     async def _get_summary_options_dex_volume(self) -> dict:
         """Get summary of options DEX volume - using overview/dexs endpoint (options data not available)"""
-        try:
-            url = f"{self.base_url}/overview/dexs"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Options data is not available in the current API
-                        return {
-                            "success": True,
-                            "data": {
-                                "message": "Options volume data is not available in the current DefiLlama API",
-                                "available_data": "DEX volume data is available via overview/dexs endpoint",
-                                "total24h": data.get("total24h", 0),
-                                "total7d": data.get("total7d", 0),
-                                "total30d": data.get("total30d", 0)
-                            },
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get summary options DEX volume: {str(e)}"}
+        # Options data is not available in the current API
+        return await self._fetch_and_extract(lambda data, _: {
+            "message": "Options volume data is not available in the current DefiLlama API",
+            "available_data": "DEX volume data is available via overview/dexs endpoint",
+            **_project(data, _TOTALS_FIELDS)
+        }, "summary options DEX volume")
     
     async def _get_dex_volume_historical(self, days: int) -> dict:
         """Get DEX volume historical data - using overview/dexs endpoint with chart data"""
-        try:
-            url = f"{self.base_url}/overview/dexs"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Extract historical data from chart
-                        historical_data = {
-                            "totalDataChart": data.get("totalDataChart", []),
-                            "totalDataChartBreakdown": data.get("totalDataChartBreakdown", []),
-                            "days": days,
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0),
-                            "change_1d": data.get("change_1d", 0),
-                            "change_7d": data.get("change_7d", 0),
-                            "change_1m": data.get("change_1m", 0)
-                        }
-                        
-                        return {
-                            "success": True,
-                            "data": historical_data,
-                            "days": days,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get DEX volume historical: {str(e)}"}
+        # Extract historical data from chart
+        return await self._fetch_and_extract(lambda data, _: {
+            **_project(data, _CHART_FIELDS),
+            "days": days,
+            **_project(data, _HISTORICAL_TOTALS_FIELDS)
+        }, "DEX volume historical", need_chart=True, days=days)
     
     async def _get_dex_volume_by_protocol(self, protocol: str, days: int) -> dict:
         """Get DEX volume by protocol - using overview/dexs endpoint filtered by protocol"""
-        try:
-            url = f"{self.base_url}/overview/dexs"
+        def transform(data: Dict[str, Any], indexes: _Indexes) -> Dict[str, Any]:
+            # Filter protocols by name
+            needle = protocol.lower()
+            protocol_data = [entry for name, entry in indexes["protocols"] if needle in name]
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "protocol": protocol,
+                "protocols": protocol_data,
+                "total_protocols": len(protocol_data),
+                "days": days
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Filter protocols by name
-                        all_protocols = data.get("protocols", [])
-                        protocol_data = []
-                        
-                        if isinstance(all_protocols, list):
-                            for p in all_protocols:
-                                if isinstance(p, dict):
-                                    name = p.get("name", "").lower()
-                                    if protocol.lower() in name:
-                                        protocol_data.append(p)
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "protocol": protocol,
-                                "protocols": protocol_data,
-                                "total_protocols": len(protocol_data),
-                                "days": days
-                            },
-                            "protocol": protocol,
-                            "days": days,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get DEX volume by protocol: {str(e)}"}
+        
+        return await self._fetch_and_extract(transform, "DEX volume by protocol", protocol=protocol, days=days)
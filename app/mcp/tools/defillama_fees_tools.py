@@ -1,20 +1,166 @@
 import asyncio
+import heapq
+import itertools
 import logging
 import aiohttp
 import json
 import os
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .mcp_tool import MCPTool
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode br-encoded bodies
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 logger = logging.getLogger(__name__)
 
+# Every action reads the same /overview/fees payload; reuse it briefly
+_OVERVIEW_TTL = 30.0
+
+# Parsed payload plus name indexes: "protocols"/"chains" -> [(lowercased name, entry), ...]
+_Names = Dict[str, List[Tuple[str, Dict[str, Any]]]]
+_Overview = Tuple[Dict[str, Any], _Names]
+
+# Query suffix that makes DefiLlama omit totalDataChart/totalDataChartBreakdown
+_EXCLUDE_CHARTS = "?excludeTotalDataChart=true&excludeTotalDataChartBreakdown=true"
+
+# Sent with every overview GET; a GET has no body, so no Content-Type.
+# aiohttp decompresses the body transparently.
+_JSON_HEADERS = {"Accept": "application/json", "Accept-Encoding": _ACCEPT_ENCODING}
+
+# Transient upstream statuses worth retrying, and how many tries a fetch gets
+_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+_MAX_ATTEMPTS = 3
+
+# Fields kept per protocol in get_fees_breakdown
+_PROTOCOL_BREAKDOWN_FIELDS = (
+    "name", "category", "chains", "total24h", "total7d", "total30d", "change_1d", "change_7d",
+)
+
+# URL -> (fetched at, parsed payload and name indexes)
+_overview_cache: Dict[str, Tuple[float, _Overview]] = {}
+# URL -> fetch in progress, so concurrent misses share one request
+_overview_inflight: Dict[str, "asyncio.Future[_Overview]"] = {}
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before the next attempt: Retry-After when numeric, else 2**attempt, clamped to [0.5, 30]"""
+    try:
+        delay = float(retry_after) if retry_after else 2 ** attempt
+    except ValueError:  # HTTP-date form; fall back to exponential backoff
+        delay = 2 ** attempt
+    return min(max(delay, 0.5), 30.0)
+
+
+def _index_by_name(entries: Any) -> List[Tuple[str, Dict[str, Any]]]:
+    """Pair each dict entry with its lowercased name, preserving payload order"""
+    if not isinstance(entries, list):
+        return []
+    return [((entry.get("name") or "").lower(), entry) for entry in entries if isinstance(entry, dict)]
+
+
+def _summary_view(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Headline totals and changes plus protocol/chain counts"""
+    return {
+        "total24h": data.get("total24h", 0),
+        "total7d": data.get("total7d", 0),
+        "total30d": data.get("total30d", 0),
+        "total1y": data.get("total1y", 0),
+        "change_1d": data.get("change_1d", 0),
+        "change_7d": data.get("change_7d", 0),
+        "change_1m": data.get("change_1m", 0),
+        "totalAllTime": data.get("totalAllTime", 0),
+        "protocols_count": len(data.get("protocols", [])),
+        "chains_count": len(data.get("allChains", []))
+    }
+
+
+def _historical_view(data: Dict[str, Any], days: int) -> Dict[str, Any]:
+    """Chart series with the headline totals and changes"""
+    return {
+        "totalDataChart": data.get("totalDataChart", []),
+        "totalDataChartBreakdown": data.get("totalDataChartBreakdown", []),
+        "days": days,
+        "total24h": data.get("total24h", 0),
+        "total7d": data.get("total7d", 0),
+        "total30d": data.get("total30d", 0),
+        "change_1d": data.get("change_1d", 0),
+        "change_7d": data.get("change_7d", 0),
+        "change_1m": data.get("change_1m", 0)
+    }
+
+
+def _breakdown_view(data: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """First `limit` protocols in payload order, projected onto _PROTOCOL_BREAKDOWN_FIELDS"""
+    # Projected so per-protocol chain breakdowns are not serialized back to the client
+    protocols = [
+        {k: p.get(k) for k in _PROTOCOL_BREAKDOWN_FIELDS}
+        for p in itertools.islice(data.get("protocols", []), limit or None)
+    ]
+    return {
+        "protocols": protocols,
+        "total_protocols": len(protocols),
+        "total24h": data.get("total24h", 0),
+        "total7d": data.get("total7d", 0),
+        "total30d": data.get("total30d", 0)
+    }
+
+
+def _fees_24h(protocol: Dict[str, Any]) -> float:
+    """Sort key for protocols by 24h fees; a null total24h ranks as 0"""
+    return protocol.get("total24h") or 0
+
+
+def _top_generators_view(data: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """Top `limit` protocols by 24h fees, highest first"""
+    protocols = data.get("protocols", [])
+    if isinstance(protocols, list):
+        # Both paths copy, leaving the cached list untouched
+        if limit:
+            protocols = heapq.nlargest(limit, protocols, key=_fees_24h)
+        else:
+            protocols = sorted(protocols, key=_fees_24h, reverse=True)
+    return {
+        "protocols": protocols,
+        "total_protocols": len(protocols),
+        "total24h": data.get("total24h", 0),
+        "total7d": data.get("total7d", 0),
+        "total30d": data.get("total30d", 0)
+    }
+
+
 class DefiLlamaFeesTool(MCPTool):
     """DefiLlama Fees MCP tool for accessing protocol fees and revenue data"""
     
+    # Shared by every instance so the connection pool stays warm across tool instantiations
+    _session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    
+    # action -> (handler, arguments passed to it, required argument, error if it is missing)
+    _ACTIONS: ClassVar[Dict[str, Tuple[str, Tuple[str, ...], Optional[str], Optional[str]]]] = {
+        "get_fees_and_revenue_overview": ("_get_fees_and_revenue_overview", (), None, None),
+        "get_fees_overview_by_chain": ("_get_fees_overview_by_chain", ("chain",), "chain", "Chain is required for this action"),
+        "get_summary_fees": ("_get_summary_fees", (), None, None),
+        "get_fees_historical": ("_get_fees_historical", ("days",), None, None),
+        "get_fees_by_protocol": ("_get_fees_by_protocol", ("protocol", "days"), "protocol", "Protocol is required for this action"),
+        "get_revenue_by_protocol": ("_get_revenue_by_protocol", ("protocol", "days"), "protocol", "Protocol is required for this action"),
+        "get_fees_breakdown": ("_get_fees_breakdown", ("limit",), None, None),
+        "get_top_fee_generators": ("_get_top_fee_generators", ("limit",), None, None),
+        "get_fees_dashboard": ("_get_fees_dashboard", ("limit", "days"), None, None),
+    }
+    _ARG_DEFAULTS: ClassVar[Dict[str, Any]] = {"days": 30, "limit": 100}
+    
     def __init__(self):
-        self.session = None
         self.base_url = "https://api.llama.fi"
         
     @property
@@ -32,16 +178,8 @@ class DefiLlamaFeesTool(MCPTool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": [
-                        "get_fees_and_revenue_overview",
-                        "get_fees_overview_by_chain",
-                        "get_summary_fees",
-                        "get_fees_historical",
-                        "get_fees_by_protocol",
-                        "get_revenue_by_protocol",
-                        "get_fees_breakdown",
-                        "get_top_fee_generators"
-                    ],
+                    # Derived from the dispatch table so the two cannot drift apart
+                    "enum": list(self._ACTIONS),
                     "description": "Action to perform"
                 },
                 "chain": {
@@ -64,439 +202,221 @@ class DefiLlamaFeesTool(MCPTool):
             "required": ["action"]
         }
     
-    async def _get_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-        return self.session
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        # One pooled session for the process keeps TLS connections to api.llama.fi warm; it is
+        # closed by MCPTool.close() at server shutdown. Nothing is awaited between the check and
+        # the assignment, so concurrent callers cannot both create one.
+        if cls._session is None or cls._session.closed:
+            # Idle sockets (and their TLS sessions) outlive sporadic calls; closed transports are reaped
+            connector = aiohttp.TCPConnector(
+                limit=64, limit_per_host=16, keepalive_timeout=120, ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+            )
+            cls._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=15))
+        return cls._session
     
     async def _cleanup_session(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
+        cls = type(self)
+        if cls._session:
+            await cls._session.close()
+            cls._session = None
+    
+    async def _fetch_overview(self, need_chart: bool = False) -> _Overview:
+        """Return the parsed /overview/fees payload and its name indexes, cached for _OVERVIEW_TTL seconds
+        
+        Unless need_chart is set, the lean variant without the chart arrays (the bulk of
+        the payload) is requested; the two variants are cached separately.
+        """
+        url = f"{self.base_url}/overview/fees"
+        if not need_chart:
+            url += _EXCLUDE_CHARTS
+        cached = _overview_cache.get(url)
+        if cached and time.monotonic() - cached[0] < _OVERVIEW_TTL:
+            return cached[1]
+        
+        # Concurrent misses share one upstream fetch instead of each issuing their own
+        task = _overview_inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._load_overview(url))
+            _overview_inflight[url] = task
+            task.add_done_callback(lambda _: _overview_inflight.pop(url, None))
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _load_overview(self, url: str) -> _Overview:
+        """GET and parse url, index it by name and store the result in the shared cache"""
+        session = await self._get_session()
+        for attempt in range(_MAX_ATTEMPTS):
+            final = attempt == _MAX_ATTEMPTS - 1
+            try:
+                async with session.get(url, headers=_JSON_HEADERS) as response:
+                    if response.status in _RETRY_STATUSES and not final:
+                        # Throttled or gateway hiccup: back off, preferring the server's hint
+                        delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                        body = (await response.text())[:200]
+                        logger.warning(
+                            "DefiLlama fees returned %s (attempt %d/%d), retrying in %.1fs: %s",
+                            response.status, attempt + 1, _MAX_ATTEMPTS, delay, body,
+                        )
+                    else:
+                        if response.status != 200:
+                            raise RuntimeError(f"API request failed with status {response.status}")
+                        # Parse the raw bytes; decoding to str first would copy the whole payload
+                        raw = await response.read()
+                        logger.debug(
+                            "DefiLlama fees overview: %d decoded bytes, content-encoding %s",
+                            len(raw), response.headers.get("Content-Encoding", "identity"),
+                        )
+                        try:
+                            data = _json_loads(raw)
+                        except Exception as json_error:
+                            content_type = response.headers.get('content-type', 'Not specified')
+                            snippet = raw[:200].decode('utf-8', 'replace')
+                            # The traceback keeps this frame alive; do not let it pin the body
+                            del raw
+                            raise ValueError(f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {snippet}...")
+                        break
+            except aiohttp.ClientError as e:
+                if final:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(
+                    "DefiLlama fees request failed (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1, _MAX_ATTEMPTS, delay, e,
+                )
+            await asyncio.sleep(delay)
+        # The parsed payload is the only copy kept while the indexes are built
+        del raw
+        
+        # Lowercased once per refresh instead of on every filtered call
+        overview = (data, {
+            "protocols": _index_by_name(data.get("protocols", [])),
+            "chains": _index_by_name(data.get("allChains", [])),
+        })
+        _overview_cache[url] = (time.monotonic(), overview)
+        return overview
     
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         try:
             action = arguments.get("action")
-            chain = arguments.get("chain")
-            protocol = arguments.get("protocol")
-            days = arguments.get("days", 30)
-            limit = arguments.get("limit", 100)
             
             # Validate action
             if not action:
-                result = {"success": False, "error": "Action is required. Please select an action."}
-            elif action == "get_fees_and_revenue_overview":
-                result = await self._get_fees_and_revenue_overview()
-            elif action == "get_fees_overview_by_chain":
-                if not chain:
-                    result = {"success": False, "error": "Chain is required for this action"}
-                else:
-                    result = await self._get_fees_overview_by_chain(chain)
-            elif action == "get_summary_fees":
-                result = await self._get_summary_fees()
-            elif action == "get_fees_historical":
-                result = await self._get_fees_historical(days)
-            elif action == "get_fees_by_protocol":
-                if not protocol:
-                    result = {"success": False, "error": "Protocol is required for this action"}
-                else:
-                    result = await self._get_fees_by_protocol(protocol, days)
-            elif action == "get_revenue_by_protocol":
-                if not protocol:
-                    result = {"success": False, "error": "Protocol is required for this action"}
-                else:
-                    result = await self._get_revenue_by_protocol(protocol, days)
-            elif action == "get_fees_breakdown":
-                result = await self._get_fees_breakdown(limit)
-            elif action == "get_top_fee_generators":
-                result = await self._get_top_fee_generators(limit)
-            else:
-                result = {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: get_fees_and_revenue_overview, get_fees_overview_by_chain, get_summary_fees, get_fees_historical, get_fees_by_protocol, get_revenue_by_protocol, get_fees_breakdown, get_top_fee_generators"}
+                return [{"success": False, "error": "Action is required. Please select an action."}]
+            spec = self._ACTIONS.get(action)
+            if spec is None:
+                return [{"success": False, "error": f"Unknown action: '{action}'. Valid actions are: {', '.join(self._ACTIONS)}"}]
             
-            return [result]
-        finally:
-            await self._cleanup_session()
+            method_name, params, required, missing_error = spec
+            if required and not arguments.get(required):
+                return [{"success": False, "error": missing_error}]
+            
+            args = [arguments.get(k, self._ARG_DEFAULTS.get(k)) for k in params]
+            return [await getattr(self, method_name)(*args)]
+        except Exception as e:
+            logger.error(f"Error in DefiLlama fees tool: {e}")
+            return [{"success": False, "error": f"Error: {str(e)}"}]
     
-    async def _get_fees_and_revenue_overview(self) -> dict:
-        """Get fees and revenue overview - using overview/fees endpoint"""
+    async def _fetch_and_extract(self, transform: Callable[[Dict[str, Any], _Names], Any], failure: str,
+                                 *, need_chart: bool = False, **extra: Any) -> dict:
+        """Apply transform to the shared overview payload and its name indexes and wrap it in the result envelope
+        
+        Keys in extra are echoed between "data" and "timestamp"; any error is reported
+        as "Failed to get <failure>".
+        """
         try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            data, names = await self._fetch_overview(need_chart)
+            return {
+                "success": True,
+                "data": transform(data, names),
+                **extra,
+                "timestamp": datetime.now().isoformat()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Extract fees overview data
-                        fees_data = {
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0),
-                            "total1y": data.get("total1y", 0),
-                            "change_1d": data.get("change_1d", 0),
-                            "change_7d": data.get("change_7d", 0),
-                            "change_1m": data.get("change_1m", 0),
-                            "totalAllTime": data.get("totalAllTime", 0),
-                            "protocols": data.get("protocols", []),
-                            "allChains": data.get("allChains", []),
-                            "totalDataChart": data.get("totalDataChart", []),
-                            "totalDataChartBreakdown": data.get("totalDataChartBreakdown", [])
-                        }
-                        
-                        return {
-                            "success": True,
-                            "data": fees_data,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
-            return {"success": False, "error": f"Failed to get fees and revenue overview: {str(e)}"}
+            return {"success": False, "error": f"Failed to get {failure}: {str(e)}"}
+    
+    async def _get_fees_and_revenue_overview(self) -> dict:
+        """Get fees and revenue overview - using overview/fees endpoint"""
+        return await self._fetch_and_extract(lambda data, _: {
+            "total24h": data.get("total24h", 0),
+            "total7d": data.get("total7d", 0),
+            "total30d": data.get("total30d", 0),
+            "total1y": data.get("total1y", 0),
+            "change_1d": data.get("change_1d", 0),
+            "change_7d": data.get("change_7d", 0),
+            "change_1m": data.get("change_1m", 0),
+            "totalAllTime": data.get("totalAllTime", 0),
+            "protocols": data.get("protocols", []),
+            "allChains": data.get("allChains", []),
+            "totalDataChart": data.get("totalDataChart", []),
+            "totalDataChartBreakdown": data.get("totalDataChartBreakdown", [])
+        }, "fees and revenue overview", need_chart=True)
     
     async def _get_fees_overview_by_chain(self, chain: str) -> dict:
         """Get fees overview by chain - using overview/fees endpoint filtered by chain"""
-        try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Filter chains by name
-                        all_chains = data.get("allChains", [])
-                        chain_data = []
-                        
-                        if isinstance(all_chains, list):
-                            for c in all_chains:
-                                if isinstance(c, dict):
-                                    chain_name = c.get("name", "").lower()
-                                    if chain.lower() in chain_name:
-                                        chain_data.append(c)
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "chain": chain,
-                                "chains": chain_data,
-                                "total_chains": len(chain_data)
-                            },
-                            "chain": chain,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get fees overview by chain: {str(e)}"}
+        def transform(_: Dict[str, Any], names: _Names) -> Dict[str, Any]:
+            needle = chain.lower()
+            chain_data = [c for name, c in names["chains"] if needle in name]
+            return {"chain": chain, "chains": chain_data, "total_chains": len(chain_data)}
+        
+        return await self._fetch_and_extract(transform, "fees overview by chain", chain=chain)
     
     async def _get_summary_fees(self) -> dict:
         """Get summary of fees - using overview/fees endpoint"""
-        try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Extract summary data
-                        summary_data = {
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0),
-                            "total1y": data.get("total1y", 0),
-                            "change_1d": data.get("change_1d", 0),
-                            "change_7d": data.get("change_7d", 0),
-                            "change_1m": data.get("change_1m", 0),
-                            "totalAllTime": data.get("totalAllTime", 0),
-                            "protocols_count": len(data.get("protocols", [])),
-                            "chains_count": len(data.get("allChains", []))
-                        }
-                        
-                        return {
-                            "success": True,
-                            "data": summary_data,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get summary fees: {str(e)}"}
+        return await self._fetch_and_extract(lambda data, _: _summary_view(data), "summary fees")
     
     async def _get_fees_historical(self, days: int) -> dict:
         """Get fees historical data - using overview/fees endpoint with chart data"""
-        try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Extract historical data from chart
-                        historical_data = {
-                            "totalDataChart": data.get("totalDataChart", []),
-                            "totalDataChartBreakdown": data.get("totalDataChartBreakdown", []),
-                            "days": days,
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0),
-                            "change_1d": data.get("change_1d", 0),
-                            "change_7d": data.get("change_7d", 0),
-                            "change_1m": data.get("change_1m", 0)
-                        }
-                        
-                        return {
-                            "success": True,
-                            "data": historical_data,
-                            "days": days,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get fees historical: {str(e)}"}
+        return await self._fetch_and_extract(lambda data, _: _historical_view(data, days), "fees historical",
+                                             need_chart=True, days=days)
     
     async def _get_fees_by_protocol(self, protocol: str, days: int) -> dict:
         """Get fees by protocol - using overview/fees endpoint filtered by protocol"""
-        try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+        def transform(_: Dict[str, Any], names: _Names) -> Dict[str, Any]:
+            needle = protocol.lower()
+            protocol_data = [p for name, p in names["protocols"] if needle in name]
+            return {
+                "protocol": protocol,
+                "protocols": protocol_data,
+                "total_protocols": len(protocol_data),
+                "days": days
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Filter protocols by name
-                        all_protocols = data.get("protocols", [])
-                        protocol_data = []
-                        
-                        if isinstance(all_protocols, list):
-                            for p in all_protocols:
-                                if isinstance(p, dict):
-                                    name = p.get("name", "").lower()
-                                    if protocol.lower() in name:
-                                        protocol_data.append(p)
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "protocol": protocol,
-                                "protocols": protocol_data,
-                                "total_protocols": len(protocol_data),
-                                "days": days
-                            },
-                            "protocol": protocol,
-                            "days": days,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get fees by protocol: {str(e)}"}
+        
+        return await self._fetch_and_extract(transform, "fees by protocol", protocol=protocol, days=days)
     
     async def _get_revenue_by_protocol(self, protocol: str, days: int) -> dict:
         """Get revenue by protocol - using overview/fees endpoint filtered by protocol"""
-        try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+        def transform(_: Dict[str, Any], names: _Names) -> Dict[str, Any]:
+            # Revenue data is included in fees data
+            needle = protocol.lower()
+            protocol_data = [p for name, p in names["protocols"] if needle in name]
+            return {
+                "protocol": protocol,
+                "protocols": protocol_data,
+                "total_protocols": len(protocol_data),
+                "days": days,
+                "note": "Revenue data is included in fees data from DefiLlama API"
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Filter protocols by name (revenue data is included in fees data)
-                        all_protocols = data.get("protocols", [])
-                        protocol_data = []
-                        
-                        if isinstance(all_protocols, list):
-                            for p in all_protocols:
-                                if isinstance(p, dict):
-                                    name = p.get("name", "").lower()
-                                    if protocol.lower() in name:
-                                        protocol_data.append(p)
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "protocol": protocol,
-                                "protocols": protocol_data,
-                                "total_protocols": len(protocol_data),
-                                "days": days,
-                                "note": "Revenue data is included in fees data from DefiLlama API"
-                            },
-                            "protocol": protocol,
-                            "days": days,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get revenue by protocol: {str(e)}"}
+        
+        return await self._fetch_and_extract(transform, "revenue by protocol", protocol=protocol, days=days)
     
     async def _get_fees_breakdown(self, limit: int) -> dict:
         """Get fees breakdown - using overview/fees endpoint with protocols data"""
-        try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Get protocols data as breakdown
-                        protocols = data.get("protocols", [])
-                        if limit and len(protocols) > limit:
-                            protocols = protocols[:limit]
-                        
-                        breakdown_data = {
-                            "protocols": protocols,
-                            "total_protocols": len(protocols),
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0)
-                        }
-                        
-                        return {
-                            "success": True,
-                            "data": breakdown_data,
-                            "limit": limit,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get fees breakdown: {str(e)}"}
+        return await self._fetch_and_extract(lambda data, _: _breakdown_view(data, limit), "fees breakdown",
+                                             limit=limit)
     
     async def _get_top_fee_generators(self, limit: int) -> dict:
         """Get top fee generators - using overview/fees endpoint with sorted protocols"""
-        try:
-            url = f"{self.base_url}/overview/fees"
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # Get protocols and sort by 24h fees
-                        protocols = data.get("protocols", [])
-                        if isinstance(protocols, list):
-                            # Sort by total24h descending
-                            protocols.sort(key=lambda x: x.get("total24h", 0), reverse=True)
-                            if limit and len(protocols) > limit:
-                                protocols = protocols[:limit]
-                        
-                        top_generators = {
-                            "protocols": protocols,
-                            "total_protocols": len(protocols),
-                            "total24h": data.get("total24h", 0),
-                            "total7d": data.get("total7d", 0),
-                            "total30d": data.get("total30d", 0)
-                        }
-                        
-                        return {
-                            "success": True,
-                            "data": top_generators,
-                            "limit": limit,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get top fee generators: {str(e)}"}
+        return await self._fetch_and_extract(lambda data, _: _top_generators_view(data, limit),
+                                             "top fee generators", limit=limit)
+    
+    async def _get_fees_dashboard(self, limit: int, days: int) -> dict:
+        """Get summary, breakdown, top generators and historical views from a single overview fetch"""
+        # The views are plain projections of the cached payload, so no further awaits
+        return await self._fetch_and_extract(lambda data, _: {
+            "summary": _summary_view(data),
+            "breakdown": _breakdown_view(data, limit),
+            "top_generators": _top_generators_view(data, limit),
+            "historical": _historical_view(data, days)
+        }, "fees dashboard", need_chart=True, limit=limit, days=days)
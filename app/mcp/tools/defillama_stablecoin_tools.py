@@ -1,21 +1,113 @@
 import asyncio
+import heapq
 import logging
 import aiohttp
 import json
 import os
-from typing import Any, Dict, List, Optional
+import re
+import time
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .mcp_tool import MCPTool
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode br-encoded bodies
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 logger = logging.getLogger(__name__)
 
+# Sent with every GET, read-only so no caller can mutate the shared dict; there is no
+# request body, so no Content-Type. aiohttp decompresses the body transparently.
+_JSON_HEADERS = MappingProxyType({
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+})
+
+# /protocols and /chains are shared by every action; reuse a parsed response briefly
+_RESPONSE_TTL = 30.0
+
+# Stablecoin-related /protocols entries, total entry count, and their market caps (null as 0)
+_Stable = Tuple[List[Dict[str, Any]], int, List[Any]]
+
+# Returned by _load_json when a revalidated URL has not changed upstream
+_NOT_MODIFIED = object()
+
+# (second, formatted) - responses within the same second share one timestamp string
+_ts_cache: List[Any] = [0, ""]
+
+
+def _iso_now() -> str:
+    """Local ISO-8601 timestamp at one-second resolution, formatted at most once a second"""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _ts_cache[1]
+
+
+# A protocol is stablecoin-related when its lowercased name or category contains one of these
+_KEYWORDS = ('stablecoin', 'usd', 'usdc', 'usdt', 'dai', 'frax', 'lusd')
+# One C-level scan per string instead of a Python-level loop over the keywords
+_STABLE_RE = re.compile("|".join(map(re.escape, _KEYWORDS)))
+
+# Projections of a /protocols record returned by the stablecoin actions
+_PRICE_KEYS = ('name', 'symbol', 'tvl', 'change_1d', 'change_7d', 'mcap')
+_HISTORY_KEYS = ('name', 'symbol', 'tvl', 'change_1d', 'change_7d', 'change_1h', 'mcap', 'chains')
+_MCAP_KEYS = ('name', 'symbol', 'mcap', 'tvl', 'change_1d', 'change_7d', 'chains')
+_DEFAULTS = {
+    'name': None, 'symbol': None,
+    'tvl': 0, 'mcap': 0,
+    'change_1h': 0, 'change_1d': 0, 'change_7d': 0,
+    'chains': [],
+}
+# Per-projection defaults in output order; present keys are overlaid via keys() intersection
+_PRICE_FIELDS = {k: _DEFAULTS[k] for k in _PRICE_KEYS}
+_HISTORY_FIELDS = {k: _DEFAULTS[k] for k in _HISTORY_KEYS}
+_MCAP_FIELDS = {k: _DEFAULTS[k] for k in _MCAP_KEYS}
+
+
+def _project(data: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the given fields out of data, falling back to their defaults, in one pass"""
+    return {**fields, **{k: data[k] for k in fields.keys() & data.keys()}}
+
+
+def _is_stable(protocol: Dict[str, Any]) -> bool:
+    """Whether a /protocols entry looks stablecoin-related by name or category"""
+    name = protocol.get('name') or ''
+    category = protocol.get('category') or ''
+    if not name and not category:
+        return False
+    # One lowercase and one scan over both fields; no keyword contains the separator, so
+    # a match cannot straddle name and category
+    return _STABLE_RE.search((name + '\n' + category).lower()) is not None
+
+
 class DefiLlamaStablecoinTool(MCPTool):
     """DefiLlama Stablecoin MCP tool for accessing stablecoin data"""
     
+    # Shared by every instance so the connection pool stays warm across tool instantiations
+    _session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    
     def __init__(self):
-        self.session = None
         self.base_url = "https://api.llama.fi"
+        # URL -> (fetched at, parsed JSON body)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # /protocols URL -> (fetched at, (stablecoin-related entries, total entry count))
+        self._stable_cache: Dict[str, Tuple[float, _Stable]] = {}
+        # URL -> (ETag, Last-Modified) of its last download, for conditional revalidation
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # (kind, URL) -> refresh in progress, so concurrent misses share one request
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
         
     @property
     def name(self) -> str:
@@ -42,6 +134,11 @@ class DefiLlamaStablecoinTool(MCPTool):
                     ],
                     "description": "Action to perform"
                 },
+                "actions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Several actions to run concurrently against one /protocols fetch (used instead of action)"
+                },
                 "chain": {
                     "type": "string",
                     "description": "Blockchain network (for chain-specific queries)"
@@ -53,341 +150,271 @@ class DefiLlamaStablecoinTool(MCPTool):
                 "days": {
                     "type": "integer",
                     "description": "Number of days for historical data (default: 30)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Return only the top N stablecoins by market cap (get_stablecoin_historical_mcap; default: all)"
                 }
             },
-            "required": ["action"]
+            "anyOf": [{"required": ["action"]}, {"required": ["actions"]}]
         }
     
-    async def _get_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-        return self.session
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        # One pooled session for the process keeps TLS connections to api.llama.fi warm; it is
+        # closed by MCPTool.close() at server shutdown. Nothing is awaited between the check and
+        # the assignment, so concurrent callers cannot both create one.
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            cls._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+        return cls._session
     
     async def _cleanup_session(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
+        cls = type(self)
+        if cls._session:
+            await cls._session.close()
+            cls._session = None
+    
+    async def _fetch_json(self, url: str, ttl: float = _RESPONSE_TTL) -> Any:
+        """GET url and return its parsed JSON body, reusing a response younger than ttl seconds"""
+        cached = self._cache.get(url)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return await self._single_flight(("json", url), lambda: self._refresh_json(url))
+    
+    async def _refresh_json(self, url: str) -> Any:
+        """Download (or revalidate) url and store its parsed body in the response cache"""
+        cached = self._cache.get(url)
+        data = await self._load_json(url, revalidate=cached is not None)
+        if data is _NOT_MODIFIED:
+            data = cached[1]
+        self._cache[url] = (time.monotonic(), data)
+        return data
+    
+    async def _stable_protocols(self) -> _Stable:
+        """Return the stablecoin-related /protocols entries, the total entry count and their
+        market cap column, cached for _RESPONSE_TTL seconds
+        
+        Only the filtered entries are kept, so the full protocol list (several MB parsed)
+        is released as soon as it has been filtered rather than held for the whole TTL.
+        """
+        url = f"{self.base_url}/protocols"
+        cached = self._stable_cache.get(url)
+        if cached and time.monotonic() - cached[0] < _RESPONSE_TTL:
+            return cached[1]
+        return await self._single_flight(("stable", url), lambda: self._refresh_stable(url))
+    
+    async def _refresh_stable(self, url: str) -> _Stable:
+        """Download (or revalidate) /protocols and store its stablecoin subset in the cache"""
+        cached = self._stable_cache.get(url)
+        all_protocols = await self._load_json(url, revalidate=cached is not None)
+        if all_protocols is _NOT_MODIFIED:
+            # Unchanged upstream: keep the subset filtered from the previous download
+            self._stable_cache[url] = (time.monotonic(), cached[1])
+            return cached[1]
+        entries = [p for p in all_protocols if isinstance(p, dict) and _is_stable(p)]
+        # Market caps (null as 0) as a column parallel to entries, built once per refresh
+        # for the sum and the ranking instead of re-reading every dict on each call
+        stable = (entries, len(all_protocols), [p.get('mcap') or 0 for p in entries])
+        self._stable_cache[url] = (time.monotonic(), stable)
+        return stable
+    
+    async def _single_flight(self, key: Tuple[str, str], load: Callable[[], Awaitable[Any]]) -> Any:
+        """Await load(), sharing one in-flight call among every concurrent caller with the same key"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _load_json(self, url: str, revalidate: bool = False) -> Any:
+        """GET url and parse its JSON body, raising on a non-200 status or an unparseable body
+        
+        With revalidate set, the validators of the last download of url are sent and
+        _NOT_MODIFIED is returned if the server answers 304.
+        """
+        headers = _JSON_HEADERS
+        etag, last_modified = self._validators.get(url, (None, None)) if revalidate else (None, None)
+        if etag or last_modified:
+            headers = dict(_JSON_HEADERS)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and revalidate:
+                return _NOT_MODIFIED
+            if response.status != 200:
+                raise RuntimeError(f"API request failed with status {response.status}")
+            # Parse the raw bytes; decoding to str first would copy the whole payload
+            raw = await response.read()
+            try:
+                data = _json_loads(raw)
+            except Exception as json_error:
+                content_type = response.headers.get('content-type', 'Not specified')
+                snippet = raw[:200].decode('utf-8', 'replace')
+                raise ValueError(f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {snippet}...")
+            self._validators[url] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return data
     
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
-        try:
-            action = arguments.get("action")
-            chain = arguments.get("chain")
-            stablecoin = arguments.get("stablecoin")
-            days = arguments.get("days", 30)
-            
-            # Validate action
-            if not action:
-                result = {"success": False, "error": "Action is required. Please select an action."}
-            elif action == "get_stablecoins":
-                result = await self._get_stablecoins()
-            elif action == "get_stablecoin_prices":
-                result = await self._get_stablecoin_prices()
-            elif action == "get_stablecoin_chains":
-                result = await self._get_stablecoin_chains()
-            elif action == "get_stablecoin_history":
-                result = await self._get_stablecoin_history(days)
-            elif action == "get_stablecoin_mcap_sum":
-                result = await self._get_stablecoin_mcap_sum()
-            elif action == "get_stablecoin_historical_mcap":
-                result = await self._get_stablecoin_historical_mcap(days)
-            else:
-                result = {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: get_stablecoins, get_stablecoin_prices, get_stablecoin_chains, get_stablecoin_history, get_stablecoin_mcap_sum, get_stablecoin_historical_mcap"}
-            
-            return [result]
-        finally:
-            await self._cleanup_session()
+        actions = arguments.get("actions")
+        if actions:
+            # Answer every action concurrently; their cache misses coalesce into one fetch per URL
+            return list(await asyncio.gather(*(self._dispatch(action, arguments) for action in actions)))
+        
+        return [await self._dispatch(arguments.get("action"), arguments)]
+    
+    async def _dispatch(self, action: Optional[str], arguments: Dict[str, Any]) -> dict:
+        days = arguments.get("days", 30)
+        
+        # Validate action
+        if not action:
+            result = {"success": False, "error": "Action is required. Please select an action."}
+        elif action == "get_stablecoins":
+            result = await self._get_stablecoins()
+        elif action == "get_stablecoin_prices":
+            result = await self._get_stablecoin_prices()
+        elif action == "get_stablecoin_chains":
+            result = await self._get_stablecoin_chains()
+        elif action == "get_stablecoin_history":
+            result = await self._get_stablecoin_history(days)
+        elif action == "get_stablecoin_mcap_sum":
+            result = await self._get_stablecoin_mcap_sum()
+        elif action == "get_stablecoin_historical_mcap":
+            result = await self._get_stablecoin_historical_mcap(days, arguments.get("limit"))
+        else:
+            result = {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: get_stablecoins, get_stablecoin_prices, get_stablecoin_chains, get_stablecoin_history, get_stablecoin_mcap_sum, get_stablecoin_historical_mcap"}
+        
+        return result
     
     async def _get_stablecoins(self) -> dict:
         """Get all stablecoins data - using protocols endpoint filtered for stablecoins"""
         try:
-            url = f"{self.base_url}/protocols"
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            stablecoin_protocols, total_protocols, _ = await self._stable_protocols()
+            
+            return {
+                "success": True,
+                "data": stablecoin_protocols,
+                "total_protocols": total_protocols,
+                "stablecoin_protocols": len(stablecoin_protocols),
+                "timestamp": _iso_now()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter for stablecoin-related protocols
-                        stablecoin_protocols = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                name = protocol.get('name', '').lower()
-                                category = protocol.get('category', '').lower()
-                                if any(keyword in name or keyword in category for keyword in ['stablecoin', 'usd', 'usdc', 'usdt', 'dai', 'frax', 'lusd']):
-                                    stablecoin_protocols.append(protocol)
-                        
-                        return {
-                            "success": True,
-                            "data": stablecoin_protocols,
-                            "total_protocols": len(all_protocols),
-                            "stablecoin_protocols": len(stablecoin_protocols),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get stablecoins: {str(e)}"}
     
     async def _get_stablecoin_prices(self) -> dict:
         """Get stablecoin prices - using protocols endpoint with price data"""
         try:
-            url = f"{self.base_url}/protocols"
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            stable_protocols, _, _ = await self._stable_protocols()
+            
+            # Extract price data from the stablecoin-related protocols
+            stablecoin_prices = [_project(protocol, _PRICE_FIELDS) for protocol in stable_protocols]
+            
+            return {
+                "success": True,
+                "data": stablecoin_prices,
+                "total_stablecoins": len(stablecoin_prices),
+                "timestamp": _iso_now()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter for stablecoin-related protocols and extract price data
-                        stablecoin_prices = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                name = protocol.get('name', '').lower()
-                                category = protocol.get('category', '').lower()
-                                if any(keyword in name or keyword in category for keyword in ['stablecoin', 'usd', 'usdc', 'usdt', 'dai', 'frax', 'lusd']):
-                                    price_data = {
-                                        'name': protocol.get('name'),
-                                        'symbol': protocol.get('symbol'),
-                                        'tvl': protocol.get('tvl', 0),
-                                        'change_1d': protocol.get('change_1d', 0),
-                                        'change_7d': protocol.get('change_7d', 0),
-                                        'mcap': protocol.get('mcap', 0)
-                                    }
-                                    stablecoin_prices.append(price_data)
-                        
-                        return {
-                            "success": True,
-                            "data": stablecoin_prices,
-                            "total_stablecoins": len(stablecoin_prices),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get stablecoin prices: {str(e)}"}
     
     async def _get_stablecoin_chains(self) -> dict:
         """Get stablecoin distribution by chains - using chains endpoint"""
         try:
-            url = f"{self.base_url}/chains"
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            all_chains = await self._fetch_json(f"{self.base_url}/chains")
+            
+            # Filter for chains that might have stablecoin activity (only chains with TVL)
+            stablecoin_chains = [
+                {
+                    'name': chain.get('name'),
+                    'tvl': chain['tvl'],
+                    'tokenSymbol': chain.get('tokenSymbol'),
+                    'gecko_id': chain.get('gecko_id')
+                }
+                for chain in all_chains
+                if isinstance(chain, dict) and chain.get('tvl', 0) > 0
+            ]
+            
+            # Sort by TVL descending; every row has a positive tvl
+            stablecoin_chains.sort(key=itemgetter('tvl'), reverse=True)
+            
+            return {
+                "success": True,
+                "data": stablecoin_chains,
+                "total_chains": len(stablecoin_chains),
+                "timestamp": _iso_now()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_chains = json.loads(text_content)
-                        
-                        # Filter for chains that might have stablecoin activity
-                        stablecoin_chains = []
-                        for chain in all_chains:
-                            if isinstance(chain, dict):
-                                name = chain.get('name', '').lower()
-                                tvl = chain.get('tvl', 0)
-                                if tvl > 0:  # Only include chains with TVL
-                                    chain_data = {
-                                        'name': chain.get('name'),
-                                        'tvl': tvl,
-                                        'tokenSymbol': chain.get('tokenSymbol'),
-                                        'gecko_id': chain.get('gecko_id')
-                                    }
-                                    stablecoin_chains.append(chain_data)
-                        
-                        # Sort by TVL descending
-                        stablecoin_chains.sort(key=lambda x: x.get('tvl', 0), reverse=True)
-                        
-                        return {
-                            "success": True,
-                            "data": stablecoin_chains,
-                            "total_chains": len(stablecoin_chains),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get stablecoin chains: {str(e)}"}
     
     async def _get_stablecoin_history(self, days: int) -> dict:
         """Get stablecoin historical data - using protocols endpoint with historical data"""
         try:
-            url = f"{self.base_url}/protocols"
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            stable_protocols, _, _ = await self._stable_protocols()
+            
+            # Extract historical data from the stablecoin-related protocols
+            stablecoin_history = [_project(protocol, _HISTORY_FIELDS) for protocol in stable_protocols]
+            
+            return {
+                "success": True,
+                "data": stablecoin_history,
+                "days": days,
+                "total_stablecoins": len(stablecoin_history),
+                "timestamp": _iso_now()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter for stablecoin-related protocols and extract historical data
-                        stablecoin_history = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                name = protocol.get('name', '').lower()
-                                category = protocol.get('category', '').lower()
-                                if any(keyword in name or keyword in category for keyword in ['stablecoin', 'usd', 'usdc', 'usdt', 'dai', 'frax', 'lusd']):
-                                    historical_data = {
-                                        'name': protocol.get('name'),
-                                        'symbol': protocol.get('symbol'),
-                                        'tvl': protocol.get('tvl', 0),
-                                        'change_1d': protocol.get('change_1d', 0),
-                                        'change_7d': protocol.get('change_7d', 0),
-                                        'change_1h': protocol.get('change_1h', 0),
-                                        'mcap': protocol.get('mcap', 0),
-                                        'chains': protocol.get('chains', [])
-                                    }
-                                    stablecoin_history.append(historical_data)
-                        
-                        return {
-                            "success": True,
-                            "data": stablecoin_history,
-                            "days": days,
-                            "total_stablecoins": len(stablecoin_history),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get stablecoin history: {str(e)}"}
     
     async def _get_stablecoin_mcap_sum(self) -> dict:
         """Get total stablecoin market cap sum - calculated from protocols data"""
         try:
-            url = f"{self.base_url}/protocols"
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            _, _, mcaps = await self._stable_protocols()
+            
+            # Calculate total market cap for stablecoin-related protocols with a positive one
+            positive = [mcap for mcap in mcaps if mcap > 0]
+            total_mcap = sum(positive)
+            stablecoin_count = len(positive)
+            
+            return {
+                "success": True,
+                "data": {
+                    "total_market_cap": total_mcap,
+                    "stablecoin_count": stablecoin_count,
+                    "average_mcap": total_mcap / stablecoin_count if stablecoin_count > 0 else 0
+                },
+                "timestamp": _iso_now()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Calculate total market cap for stablecoin-related protocols
-                        total_mcap = 0
-                        stablecoin_count = 0
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                name = protocol.get('name', '').lower()
-                                category = protocol.get('category', '').lower()
-                                if any(keyword in name or keyword in category for keyword in ['stablecoin', 'usd', 'usdc', 'usdt', 'dai', 'frax', 'lusd']):
-                                    mcap = protocol.get('mcap', 0)
-                                    if mcap and mcap > 0:
-                                        total_mcap += mcap
-                                        stablecoin_count += 1
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "total_market_cap": total_mcap,
-                                "stablecoin_count": stablecoin_count,
-                                "average_mcap": total_mcap / stablecoin_count if stablecoin_count > 0 else 0
-                            },
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get stablecoin mcap sum: {str(e)}"}
     
-    async def _get_stablecoin_historical_mcap(self, days: int) -> dict:
+    async def _get_stablecoin_historical_mcap(self, days: int, limit: Optional[int] = None) -> dict:
         """Get stablecoin historical market cap data - using protocols endpoint"""
         try:
-            url = f"{self.base_url}/protocols"
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            stable_protocols, _, mcaps = await self._stable_protocols()
+            
+            # Rank by market cap descending over the column (a stable sort of indices), then
+            # project in that order; a null market cap is reported as 0. With a limit only the
+            # top `limit` are selected and projected.
+            if limit:
+                order = heapq.nlargest(limit, range(len(mcaps)), key=mcaps.__getitem__)
+            else:
+                order = sorted(range(len(mcaps)), key=mcaps.__getitem__, reverse=True)
+            stablecoin_mcap_data = [
+                {**_project(stable_protocols[i], _MCAP_FIELDS), 'mcap': mcaps[i]}
+                for i in order
+            ]
+            
+            return {
+                "success": True,
+                "data": stablecoin_mcap_data,
+                "days": days,
+                "total_stablecoins": len(stablecoin_mcap_data),
+                "timestamp": _iso_now()
             }
-            session = await self._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        all_protocols = json.loads(text_content)
-                        
-                        # Filter for stablecoin-related protocols and extract market cap data
-                        stablecoin_mcap_data = []
-                        for protocol in all_protocols:
-                            if isinstance(protocol, dict):
-                                name = protocol.get('name', '').lower()
-                                category = protocol.get('category', '').lower()
-                                if any(keyword in name or keyword in category for keyword in ['stablecoin', 'usd', 'usdc', 'usdt', 'dai', 'frax', 'lusd']):
-                                    mcap_data = {
-                                        'name': protocol.get('name'),
-                                        'symbol': protocol.get('symbol'),
-                                        'mcap': protocol.get('mcap', 0),
-                                        'tvl': protocol.get('tvl', 0),
-                                        'change_1d': protocol.get('change_1d', 0),
-                                        'change_7d': protocol.get('change_7d', 0),
-                                        'chains': protocol.get('chains', [])
-                                    }
-                                    stablecoin_mcap_data.append(mcap_data)
-                        
-                        # Sort by market cap descending
-                        stablecoin_mcap_data.sort(key=lambda x: x.get('mcap', 0), reverse=True)
-                        
-                        return {
-                            "success": True,
-                            "data": stablecoin_mcap_data,
-                            "days": days,
-                            "total_stablecoins": len(stablecoin_mcap_data),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get stablecoin historical mcap: {str(e)}"}
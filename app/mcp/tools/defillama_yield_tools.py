@@ -3,18 +3,53 @@ import logging
 import aiohttp
 import json
 import os
-from typing import Any, Dict, List, Optional
+import time
+from itertools import islice
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from .mcp_tool import MCPTool
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Every action reads the same /pools payload, which upstream refreshes about hourly
+_POOLS_TTL = float(os.getenv("DEFILLAMA_YIELD_TTL", "300"))
+
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# URL -> (fetched at, parsed pool list)
+_pools_cache: Dict[str, Tuple[float, List[Any]]] = {}
+# URL -> fetch in progress, so concurrent misses share one request
+_pools_inflight: Dict[str, "asyncio.Future[List[Any]]"] = {}
+
+
+def _filter_pools(pools: List[Any], limit: int, min_apy: Optional[float] = None,
+                  max_apy: Optional[float] = None,
+                  match: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+    """Yield the pools accepted by match and within the APY bounds, stopping after limit (0: no limit)"""
+    selected = (
+        pool for pool in pools
+        if isinstance(pool, dict)
+        and (match is None or match(pool))
+        # apy is normalised to a float or None when the payload is cached
+        and (min_apy is None or (pool.get('apy') or 0) >= min_apy)
+        and (max_apy is None or (pool.get('apy') or 0) <= max_apy)
+    )
+    return islice(selected, limit) if limit else selected
+
 class DefiLlamaYieldTool(MCPTool):
     """DefiLlama Yield MCP tool for accessing yield farming data"""
     
+    # Shared by every instance so the connection pool stays warm across tool instantiations
+    _session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    
     def __init__(self):
-        self.session = None
         self.base_url = "https://yields.llama.fi"
         
     @property
@@ -74,529 +109,266 @@ class DefiLlamaYieldTool(MCPTool):
             "required": ["action"]
         }
     
-    async def _get_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-        return self.session
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        # One pooled session for the process keeps TLS connections to yields.llama.fi warm; it is
+        # closed by MCPTool.close() at server shutdown. Nothing is awaited between the check and
+        # the assignment, so concurrent callers cannot both create one.
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75)
+            cls._session = aiohttp.ClientSession(connector=connector)
+        return cls._session
     
     async def _cleanup_session(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
+        cls = type(self)
+        if cls._session:
+            await cls._session.close()
+            cls._session = None
     
     async def execute(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
-        try:
-            action = arguments.get("action")
-            chain = arguments.get("chain")
-            protocol = arguments.get("protocol")
-            category = arguments.get("category")
-            token = arguments.get("token")
-            
-            # Handle empty strings from frontend - convert to None
-            min_apy = arguments.get("min_apy")
-            if min_apy == "" or min_apy is None:
+        action = arguments.get("action")
+        chain = arguments.get("chain")
+        protocol = arguments.get("protocol")
+        category = arguments.get("category")
+        token = arguments.get("token")
+        
+        # Handle empty strings from frontend - convert to None
+        min_apy = arguments.get("min_apy")
+        if min_apy == "" or min_apy is None:
+            min_apy = None
+        else:
+            try:
+                min_apy = float(min_apy)
+            except (ValueError, TypeError):
                 min_apy = None
-            else:
-                try:
-                    min_apy = float(min_apy)
-                except (ValueError, TypeError):
-                    min_apy = None
-                    
-            max_apy = arguments.get("max_apy")
-            if max_apy == "" or max_apy is None:
+                
+        max_apy = arguments.get("max_apy")
+        if max_apy == "" or max_apy is None:
+            max_apy = None
+        else:
+            try:
+                max_apy = float(max_apy)
+            except (ValueError, TypeError):
                 max_apy = None
+                
+        limit = arguments.get("limit", 100)
+        
+        # Validate action
+        if not action:
+            result = {"success": False, "error": "Action is required. Please select an action."}
+        elif action == "get_all_pools":
+            result = await self._get_all_pools(limit, min_apy, max_apy)
+        elif action == "get_pools_by_chain":
+            if not chain:
+                result = {"success": False, "error": "Chain is required for this action"}
             else:
-                try:
-                    max_apy = float(max_apy)
-                except (ValueError, TypeError):
-                    max_apy = None
-                    
-            limit = arguments.get("limit", 100)
-            
-            # Validate action
-            if not action:
-                result = {"success": False, "error": "Action is required. Please select an action."}
-            elif action == "get_all_pools":
-                result = await self._get_all_pools(limit, min_apy, max_apy)
-            elif action == "get_pools_by_chain":
-                if not chain:
-                    result = {"success": False, "error": "Chain is required for this action"}
-                else:
-                    result = await self._get_pools_by_chain(chain, limit, min_apy, max_apy)
-            elif action == "get_pools_by_protocol":
-                if not protocol:
-                    result = {"success": False, "error": "Protocol is required for this action"}
-                else:
-                    result = await self._get_pools_by_protocol(protocol, limit, min_apy, max_apy)
-            elif action == "get_pool_history":
-                result = await self._get_pool_history(limit)
-            elif action == "get_pools_by_category":
-                if not category:
-                    result = {"success": False, "error": "Category is required for this action"}
-                else:
-                    result = await self._get_pools_by_category(category, limit, min_apy, max_apy)
-            elif action == "get_pools_by_token":
-                if not token:
-                    result = {"success": False, "error": "Token is required for this action"}
-                else:
-                    result = await self._get_pools_by_token(token, limit, min_apy, max_apy)
+                result = await self._get_pools_by_chain(chain, limit, min_apy, max_apy)
+        elif action == "get_pools_by_protocol":
+            if not protocol:
+                result = {"success": False, "error": "Protocol is required for this action"}
             else:
-                result = {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: get_all_pools, get_pools_by_chain, get_pools_by_protocol, get_pool_history, get_pools_by_category, get_pools_by_token"}
-            
-            return [result]
-        finally:
-            await self._cleanup_session()
+                result = await self._get_pools_by_protocol(protocol, limit, min_apy, max_apy)
+        elif action == "get_pool_history":
+            result = await self._get_pool_history(limit)
+        elif action == "get_pools_by_category":
+            if not category:
+                result = {"success": False, "error": "Category is required for this action"}
+            else:
+                result = await self._get_pools_by_category(category, limit, min_apy, max_apy)
+        elif action == "get_pools_by_token":
+            if not token:
+                result = {"success": False, "error": "Token is required for this action"}
+            else:
+                result = await self._get_pools_by_token(token, limit, min_apy, max_apy)
+        else:
+            result = {"success": False, "error": f"Unknown action: '{action}'. Valid actions are: get_all_pools, get_pools_by_chain, get_pools_by_protocol, get_pool_history, get_pools_by_category, get_pools_by_token"}
+        
+        return [result]
+    
+    async def _fetch_pools_cached(self) -> List[Any]:
+        """Return the parsed /pools list, cached for _POOLS_TTL seconds"""
+        url = f"{self.base_url}/pools"
+        cached = _pools_cache.get(url)
+        if cached and time.monotonic() - cached[0] < _POOLS_TTL:
+            return cached[1]
+        
+        # Concurrent misses share one upstream fetch instead of each issuing their own
+        task = _pools_inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._load_pools(url))
+            _pools_inflight[url] = task
+            task.add_done_callback(lambda _: _pools_inflight.pop(url, None))
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _load_pools(self, url: str) -> List[Any]:
+        """GET /pools, normalise every pool's APY once and store the list in the cache"""
+        session = await self._get_session()
+        async with session.get(url, headers=_JSON_HEADERS) as response:
+            if response.status != 200:
+                raise RuntimeError(f"API request failed with status {response.status}")
+            # Parse the raw bytes; decoding the multi-MB payload to str first would copy it
+            raw = await response.read()
+            try:
+                data = _json_loads(raw)
+            except Exception as json_error:
+                content_type = response.headers.get('content-type', 'Not specified')
+                snippet = raw[:200].decode('utf-8', 'replace')
+                raise ValueError(f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {snippet}...")
+        
+        # The yields API returns {status: "success", data: [...]}
+        if isinstance(data, dict) and "data" in data:
+            pools = data["data"]
+        else:
+            pools = data
+        if not isinstance(pools, list):
+            pools = []
+        
+        # Normalize APY values so the filters can compare them directly
+        for pool in pools:
+            if isinstance(pool, dict):
+                apy = pool.get('apy')
+                if apy is not None:
+                    try:
+                        pool['apy'] = float(apy)
+                    except (ValueError, TypeError):
+                        pool['apy'] = 0.0
+        
+        _pools_cache[url] = (time.monotonic(), pools)
+        return pools
     
     async def _get_all_pools(self, limit: int, min_apy: float = None, max_apy: float = None) -> dict:
         """Get all yield pools - using yields API"""
         try:
-            url = f"{self.base_url}/pools"
-            params = {}
-            if limit:
-                params["limit"] = limit
-            if min_apy is not None:
-                params["minApy"] = min_apy
-            if max_apy is not None:
-                params["maxApy"] = max_apy
+            pools = await self._fetch_pools_cached()
+            filtered_pools = list(_filter_pools(pools, limit, min_apy, max_apy))
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": filtered_pools,
+                "limit": limit,
+                "min_apy": min_apy,
+                "max_apy": max_apy,
+                "total_pools": len(filtered_pools),
+                "timestamp": datetime.now().isoformat()
             }
-            session = await self._get_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # The yields API returns {status: "success", data: [...]}
-                        if isinstance(data, dict) and "data" in data:
-                            pools = data["data"]
-                        else:
-                            pools = data
-                        
-                        # Ensure pools is a list and normalize all APY values to prevent comparison errors
-                        if not isinstance(pools, list):
-                            pools = []
-                        
-                        # Normalize APY values in the original data to prevent comparison errors
-                        for pool in pools:
-                            if isinstance(pool, dict):
-                                apy = pool.get('apy')
-                                if apy is not None:
-                                    try:
-                                        pool['apy'] = float(apy)
-                                    except (ValueError, TypeError):
-                                        pool['apy'] = 0.0
-                        
-                        # Apply additional filtering if needed
-                        filtered_pools = []
-                        for pool in pools:
-                            if isinstance(pool, dict):
-                                apy = pool.get('apy', 0)
-                                
-                                # Convert apy to float safely
-                                try:
-                                    apy_float = float(apy) if apy is not None else 0
-                                except (ValueError, TypeError):
-                                    apy_float = 0
-                                
-                                # Apply APY filters (API should handle this, but double-check)
-                                if min_apy is not None and apy_float < min_apy:
-                                    continue
-                                if max_apy is not None and apy_float > max_apy:
-                                    continue
-                                
-                                filtered_pools.append(pool)
-                        
-                        # Apply limit if not handled by API
-                        if limit and len(filtered_pools) > limit:
-                            filtered_pools = filtered_pools[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": filtered_pools,
-                            "limit": limit,
-                            "min_apy": min_apy,
-                            "max_apy": max_apy,
-                            "total_pools": len(filtered_pools),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get all pools: {str(e)}"}
     
     async def _get_pools_by_chain(self, chain: str, limit: int, min_apy: float = None, max_apy: float = None) -> dict:
         """Get yield pools by chain - using yields API filtered by chain"""
         try:
-            url = f"{self.base_url}/pools"
-            params = {}
-            if limit:
-                params["limit"] = limit
-            if min_apy is not None:
-                params["minApy"] = min_apy
-            if max_apy is not None:
-                params["maxApy"] = max_apy
+            pools = await self._fetch_pools_cached()
+            chain_lower = chain.lower()
+            chain_pools = list(_filter_pools(
+                pools, limit, min_apy, max_apy,
+                lambda pool: chain_lower in (pool.get('chain') or '').lower()
+            ))
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": chain_pools,
+                "chain": chain,
+                "limit": limit,
+                "total_pools": len(chain_pools),
+                "timestamp": datetime.now().isoformat()
             }
-            session = await self._get_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # The yields API returns {status: "success", data: [...]}
-                        if isinstance(data, dict) and "data" in data:
-                            all_pools = data["data"]
-                        else:
-                            all_pools = data
-                        
-                        # Filter by chain
-                        chain_pools = []
-                        for pool in all_pools:
-                            if isinstance(pool, dict):
-                                pool_chain = pool.get('chain', '').lower()
-                                if chain.lower() in pool_chain:
-                                    apy = pool.get('apy', 0)
-                                    
-                                    # Convert apy to float safely
-                                    try:
-                                        apy_float = float(apy) if apy is not None else 0
-                                    except (ValueError, TypeError):
-                                        apy_float = 0
-                                    
-                                    # Apply APY filters
-                                    if min_apy is not None and apy_float < min_apy:
-                                        continue
-                                    if max_apy is not None and apy_float > max_apy:
-                                        continue
-                                    
-                                    chain_pools.append(pool)
-                        
-                        # Apply limit
-                        if limit and len(chain_pools) > limit:
-                            chain_pools = chain_pools[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": chain_pools,
-                            "chain": chain,
-                            "limit": limit,
-                            "total_pools": len(chain_pools),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get pools by chain: {str(e)}"}
     
     async def _get_pools_by_protocol(self, protocol: str, limit: int, min_apy: float = None, max_apy: float = None) -> dict:
         """Get yield pools by protocol - using yields API filtered by project name"""
         try:
-            url = f"{self.base_url}/pools"
-            params = {}
-            if limit:
-                params["limit"] = limit
-            if min_apy is not None:
-                params["minApy"] = min_apy
-            if max_apy is not None:
-                params["maxApy"] = max_apy
+            pools = await self._fetch_pools_cached()
+            protocol_lower = protocol.lower()
+            protocol_pools = list(_filter_pools(
+                pools, limit, min_apy, max_apy,
+                lambda pool: protocol_lower in (pool.get('project') or '').lower()
+            ))
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": protocol_pools,
+                "protocol": protocol,
+                "limit": limit,
+                "total_pools": len(protocol_pools),
+                "timestamp": datetime.now().isoformat()
             }
-            session = await self._get_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # The yields API returns {status: "success", data: [...]}
-                        if isinstance(data, dict) and "data" in data:
-                            all_pools = data["data"]
-                        else:
-                            all_pools = data
-                        
-                        # Filter by protocol/project
-                        protocol_pools = []
-                        for pool in all_pools:
-                            if isinstance(pool, dict):
-                                project = pool.get('project', '').lower()
-                                if protocol.lower() in project:
-                                    apy = pool.get('apy', 0)
-                                    
-                                    # Convert apy to float safely
-                                    try:
-                                        apy_float = float(apy) if apy is not None else 0
-                                    except (ValueError, TypeError):
-                                        apy_float = 0
-                                    
-                                    # Apply APY filters
-                                    if min_apy is not None and apy_float < min_apy:
-                                        continue
-                                    if max_apy is not None and apy_float > max_apy:
-                                        continue
-                                    
-                                    protocol_pools.append(pool)
-                        
-                        # Apply limit
-                        if limit and len(protocol_pools) > limit:
-                            protocol_pools = protocol_pools[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": protocol_pools,
-                            "protocol": protocol,
-                            "limit": limit,
-                            "total_pools": len(protocol_pools),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get pools by protocol: {str(e)}"}
     
     async def _get_pool_history(self, limit: int) -> dict:
         """Get pool historical data - using yields API with historical data"""
         try:
-            url = f"{self.base_url}/pools"
-            params = {}
-            if limit:
-                params["limit"] = limit
+            pools = await self._fetch_pools_cached()
+            
+            # Extract historical data from pools
+            historical_data = []
+            for pool in _filter_pools(pools, limit):
+                history_item = {
+                    'pool': pool.get('pool'),
+                    'chain': pool.get('chain'),
+                    'project': pool.get('project'),
+                    'symbol': pool.get('symbol'),
+                    'tvlUsd': pool.get('tvlUsd', 0),
+                    'apy': pool.get('apy', 0),
+                    'apyBase': pool.get('apyBase', 0),
+                    'apyReward': pool.get('apyReward', 0),
+                    'apyPct1D': pool.get('apyPct1D', 0),
+                    'apyPct7D': pool.get('apyPct7D', 0),
+                    'apyPct30D': pool.get('apyPct30D', 0),
+                    'apyMean30d': pool.get('apyMean30d', 0),
+                    'stablecoin': pool.get('stablecoin', False),
+                    'ilRisk': pool.get('ilRisk'),
+                    'exposure': pool.get('exposure'),
+                    'predictions': pool.get('predictions', {}),
+                    'mu': pool.get('mu'),
+                    'sigma': pool.get('sigma'),
+                    'count': pool.get('count'),
+                    'outlier': pool.get('outlier', False)
+                }
+                historical_data.append(history_item)
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": historical_data,
+                "limit": limit,
+                "total_pools": len(historical_data),
+                "timestamp": datetime.now().isoformat()
             }
-            session = await self._get_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # The yields API returns {status: "success", data: [...]}
-                        if isinstance(data, dict) and "data" in data:
-                            pools = data["data"]
-                        else:
-                            pools = data
-                        
-                        # Extract historical data from pools
-                        historical_data = []
-                        for pool in pools:
-                            if isinstance(pool, dict):
-                                history_item = {
-                                    'pool': pool.get('pool'),
-                                    'chain': pool.get('chain'),
-                                    'project': pool.get('project'),
-                                    'symbol': pool.get('symbol'),
-                                    'tvlUsd': pool.get('tvlUsd', 0),
-                                    'apy': pool.get('apy', 0),
-                                    'apyBase': pool.get('apyBase', 0),
-                                    'apyReward': pool.get('apyReward', 0),
-                                    'apyPct1D': pool.get('apyPct1D', 0),
-                                    'apyPct7D': pool.get('apyPct7D', 0),
-                                    'apyPct30D': pool.get('apyPct30D', 0),
-                                    'apyMean30d': pool.get('apyMean30d', 0),
-                                    'stablecoin': pool.get('stablecoin', False),
-                                    'ilRisk': pool.get('ilRisk'),
-                                    'exposure': pool.get('exposure'),
-                                    'predictions': pool.get('predictions', {}),
-                                    'mu': pool.get('mu'),
-                                    'sigma': pool.get('sigma'),
-                                    'count': pool.get('count'),
-                                    'outlier': pool.get('outlier', False)
-                                }
-                                historical_data.append(history_item)
-                        
-                        # Apply limit
-                        if limit and len(historical_data) > limit:
-                            historical_data = historical_data[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": historical_data,
-                            "limit": limit,
-                            "total_pools": len(historical_data),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get pool history: {str(e)}"}
     
     async def _get_pools_by_category(self, category: str, limit: int, min_apy: float = None, max_apy: float = None) -> dict:
         """Get yield pools by category - using yields API with category filtering"""
         try:
-            url = f"{self.base_url}/pools"
-            params = {"category": category}
-            if limit:
-                params["limit"] = limit
-            if min_apy is not None:
-                params["minApy"] = min_apy
-            if max_apy is not None:
-                params["maxApy"] = max_apy
+            pools = await self._fetch_pools_cached()
+            filtered_pools = list(_filter_pools(pools, limit, min_apy, max_apy))
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": filtered_pools,
+                "category": category,
+                "limit": limit,
+                "total_pools": len(filtered_pools),
+                "timestamp": datetime.now().isoformat()
             }
-            session = await self._get_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # The yields API returns {status: "success", data: [...]}
-                        if isinstance(data, dict) and "data" in data:
-                            pools = data["data"]
-                        else:
-                            pools = data
-                        
-                        # Apply additional filtering if needed
-                        filtered_pools = []
-                        for pool in pools:
-                            if isinstance(pool, dict):
-                                apy = pool.get('apy', 0)
-                                
-                                # Convert apy to float safely
-                                try:
-                                    apy_float = float(apy) if apy is not None else 0
-                                except (ValueError, TypeError):
-                                    apy_float = 0
-                                
-                                # Apply APY filters (API should handle this, but double-check)
-                                if min_apy is not None and apy_float < min_apy:
-                                    continue
-                                if max_apy is not None and apy_float > max_apy:
-                                    continue
-                                
-                                filtered_pools.append(pool)
-                        
-                        # Apply limit if not handled by API
-                        if limit and len(filtered_pools) > limit:
-                            filtered_pools = filtered_pools[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": filtered_pools,
-                            "category": category,
-                            "limit": limit,
-                            "total_pools": len(filtered_pools),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get pools by category: {str(e)}"}
     
     async def _get_pools_by_token(self, token: str, limit: int, min_apy: float = None, max_apy: float = None) -> dict:
         """Get yield pools by token - using yields API with token filtering"""
         try:
-            url = f"{self.base_url}/pools"
-            params = {"token": token}
-            if limit:
-                params["limit"] = limit
-            if min_apy is not None:
-                params["minApy"] = min_apy
-            if max_apy is not None:
-                params["maxApy"] = max_apy
+            pools = await self._fetch_pools_cached()
+            filtered_pools = list(_filter_pools(pools, limit, min_apy, max_apy))
             
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json"
+            return {
+                "success": True,
+                "data": filtered_pools,
+                "token": token,
+                "limit": limit,
+                "total_pools": len(filtered_pools),
+                "timestamp": datetime.now().isoformat()
             }
-            session = await self._get_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    try:
-                        text_content = await response.text()
-                        data = json.loads(text_content)
-                        
-                        # The yields API returns {status: "success", data: [...]}
-                        if isinstance(data, dict) and "data" in data:
-                            pools = data["data"]
-                        else:
-                            pools = data
-                        
-                        # Apply additional filtering if needed
-                        filtered_pools = []
-                        for pool in pools:
-                            if isinstance(pool, dict):
-                                apy = pool.get('apy', 0)
-                                
-                                # Convert apy to float safely
-                                try:
-                                    apy_float = float(apy) if apy is not None else 0
-                                except (ValueError, TypeError):
-                                    apy_float = 0
-                                
-                                # Apply APY filters (API should handle this, but double-check)
-                                if min_apy is not None and apy_float < min_apy:
-                                    continue
-                                if max_apy is not None and apy_float > max_apy:
-                                    continue
-                                
-                                filtered_pools.append(pool)
-                        
-                        # Apply limit if not handled by API
-                        if limit and len(filtered_pools) > limit:
-                            filtered_pools = filtered_pools[:limit]
-                        
-                        return {
-                            "success": True,
-                            "data": filtered_pools,
-                            "token": token,
-                            "limit": limit,
-                            "total_pools": len(filtered_pools),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as json_error:
-                        content_type = response.headers.get('content-type', 'Not specified')
-                        return {
-                            "success": False,
-                            "error": f"Failed to parse JSON response (type: {content_type}). Error: {str(json_error)}. Response: {text_content[:200]}..."
-                        }
-                else:
-                    return {"success": False, "error": f"API request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Failed to get pools by token: {str(e)}"}
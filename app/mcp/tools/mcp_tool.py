@@ -51,3 +51,7 @@ class MCPTool(ABC):
         if self.session:
             await self.session.close()
             self.session = None
+    
+    async def close(self):
+        """Release resources held by the tool; called once at server shutdown"""
+        await self._cleanup_session()